@@ -15,14 +15,22 @@ import os
 import sys
 import platform
 import subprocess
-import tkinter as tk
-from tkinter import messagebox
+import importlib.metadata
 import importlib.util
 
+from _deps import CORE, canonical_name, platform_packages, dependencies_key, stamp_matches, write_stamp
+
+# Prefer wheels and skip byte-compiling so installs don't build or compile anything
+PIP_INSTALL_ARGS = ["install", "--prefer-binary", "--no-compile", "--disable-pip-version-check"]
+
 
 def show_message(title, message, error=False):
     """Show a message box to the user."""
     try:
+        # Only load tkinter when a message box is actually needed
+        import tkinter as tk
+        from tkinter import messagebox
+        
         root = tk.Tk()
         root.withdraw()  # Hide the main window
         if error:
@@ -36,58 +44,68 @@ def show_message(title, message, error=False):
         input("Press Enter to continue...")
 
 
-def is_dependency_installed(package_name):
-    """Check if a Python package is installed."""
-    spec = importlib.util.find_spec(package_name)
-    return spec is not None
+def pip_install(packages):
+    """Install packages with a single pip process.
+
+    pip doesn't support several installs into one environment at once, and
+    one resolver run keeps the installed versions consistent.
+    """
+    def run_pip(args):
+        cmd = [sys.executable, "-m", "pip"] + args
+        # Stream pip's output as it arrives instead of buffering all of it
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        proc.wait()
+        return proc.returncode
+
+    returncode = run_pip(PIP_INSTALL_ARGS + ["--only-binary=:all:"] + packages)
+    if returncode != 0:
+        # Some packages may have no wheel for this platform
+        print(f"Retrying {', '.join(packages)} with source builds allowed...")
+        returncode = run_pip(PIP_INSTALL_ARGS + packages)
+    if returncode != 0:
+        print(f"Error installing {', '.join(packages)} (pip exited with code {returncode})")
+
+    return returncode == 0
 
 
 def install_dependencies():
     """Install required dependencies."""
     print("Installing required dependencies...")
     
-    # List of required packages
-    required_packages = [
-        'pillow',
-        'pillow-heif', 
-        'piexif',
-        'PyQt6',
-        'pyusb',
-        'psutil'
-    ]
+    # List of required packages, including platform-specific ones
+    required_packages = list(CORE + platform_packages(platform.system()))
     
-    # Platform-specific packages
-    if platform.system() == 'Windows':
-        required_packages.extend(['wmi', 'libusb-package', 'pywin32'])
+    # Skip the check entirely if nothing changed since the last success
+    key = dependencies_key(required_packages)
+    if stamp_matches(key):
+        print("All dependencies are already installed!")
+        return True
     
-    missing_packages = []
-    for package in required_packages:
-        # Handle package name variations
-        check_name = package
-        if package == 'pillow-heif':
-            check_name = 'pillow_heif'
-        elif package == 'PyQt6':
-            check_name = 'PyQt6'
-        
-        if not is_dependency_installed(check_name):
-            missing_packages.append(package)
+    # Scan the installed distributions once instead of probing each package
+    installed = {
+        canonical_name(dist.metadata['Name'])
+        for dist in importlib.metadata.distributions()
+        if dist.metadata['Name']
+    }
+    missing_packages = [p for p in required_packages if canonical_name(p) not in installed]
     
     if not missing_packages:
         print("All dependencies are already installed!")
+        write_stamp(key)
         return True
     
     print(f"Installing missing packages: {', '.join(missing_packages)}")
     
     try:
         # Install missing packages
-        cmd = [sys.executable, "-m", "pip", "install"] + missing_packages
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if pip_install(missing_packages):
             print("Dependencies installed successfully!")
+            write_stamp(key)
             return True
         else:
-            print(f"Error installing dependencies: {result.stderr}")
             return False
             
     except Exception as e:
@@ -95,11 +113,14 @@ def install_dependencies():
         return False
 
 
-def run_main_application():
+def run_main_application(app_path):
     """Run the main iPhone Photo Converter application."""
     try:
-        # Import and run the main application
-        import iphone_photo_converter
+        # Load the main application straight from the file we already found
+        spec = importlib.util.spec_from_file_location("iphone_photo_converter", app_path)
+        iphone_photo_converter = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = iphone_photo_converter
+        spec.loader.exec_module(iphone_photo_converter)
         iphone_photo_converter.main()
     except ImportError as e:
         show_message(
@@ -121,10 +142,10 @@ def run_main_application():
 
 def check_python_version():
     """Check if Python version is compatible."""
-    if sys.version_info < (3, 6):
+    if sys.version_info < (3, 8):
         show_message(
             "Python Version Error",
-            f"This application requires Python 3.6 or newer.\n"
+            f"This application requires Python 3.8 or newer.\n"
             f"You have Python {sys.version_info.major}.{sys.version_info.minor}.\n\n"
             f"Please update Python and try again.",
             error=True
@@ -152,7 +173,10 @@ def main():
     print()
     
     # Check if main application file exists
-    if not os.path.exists("iphone_photo_converter.py"):
+    app_path = os.path.abspath("iphone_photo_converter.py")
+    try:
+        os.stat(app_path)
+    except FileNotFoundError:
         show_message(
             "File Missing",
             "The main application file 'iphone_photo_converter.py' was not found.\n\n"
@@ -176,7 +200,7 @@ def main():
     print("-" * 40)
     
     # Run the main application
-    if run_main_application():
+    if run_main_application(app_path):
         print("\nApplication closed successfully.")
     else:
         print("\nApplication encountered an error.")
@@ -30,11 +30,11 @@ check_python() {
     # Try different Python commands
     for cmd in python3 python; do
         if command -v "$cmd" &> /dev/null; then
-            # Check if it's Python 3.6+
+            # Check if it's Python 3.8+
             version_output=$($cmd --version 2>&1)
             if [[ $version_output =~ Python\ 3\.([0-9]+) ]]; then
                 minor_version=${BASH_REMATCH[1]}
-                if [ "$minor_version" -ge 6 ]; then
+                if [ "$minor_version" -ge 8 ]; then
                     echo "Python found: $cmd ($version_output)"
                     PYTHON_CMD="$cmd"
                     return 0
@@ -138,7 +138,7 @@ manual_install() {
             echo "Please consult your distribution's documentation for installing Python 3."
             echo
             echo "Generic instructions:"
-            echo "1. Install Python 3.6 or newer"
+            echo "1. Install Python 3.8 or newer"
             echo "2. Install pip (Python package manager)"
             echo "3. Install tkinter (for GUI support)"
             ;;
@@ -156,7 +156,7 @@ detect_distro
 
 # Check if Python is available
 if ! check_python; then
-    echo "Python 3.6+ not found."
+    echo "Python 3.8+ not found."
     echo
     
     # Ask user if they want to try automatic installation
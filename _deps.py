@@ -0,0 +1,67 @@
+"""
+iPhone Photo Converter - Shared Dependency Lists
+Used by both the one-click launcher and the setup script so they install the
+same packages and can tell when the other one has already done it.
+"""
+import os
+import re
+import sys
+import hashlib
+
+# Packages needed on every platform
+CORE = (
+    'pillow',
+    'pillow-heif',
+    'PyQt6',
+    'psutil',
+)
+
+# USB access and system integration packages for each platform
+PLATFORM = {
+    "Windows": ('pyusb', 'libusb-package', 'wmi', 'pywin32'),
+    "Darwin": ('pyusb',),
+    "Linux": ('pyusb',),
+}
+
+# Records the package list of the last successful dependency install
+DEPS_STAMP = os.path.join(os.path.expanduser("~"), ".cache", "iphone_photo_converter", "deps.stamp")
+
+# Runs of separators that PEP 503 treats as equivalent
+NAME_SEPARATORS_RE = re.compile(r"[-_.]+")
+
+
+def canonical_name(name):
+    """Normalize a package name so different spellings compare equal (PEP 503)."""
+    return NAME_SEPARATORS_RE.sub("-", name).lower()
+
+
+def platform_packages(system):
+    """Get the platform-specific packages, treating unknown systems like Linux."""
+    return PLATFORM.get(system, PLATFORM["Linux"])
+
+
+def dependencies_key(packages):
+    """Build a key identifying a package list and the running interpreter."""
+    data = repr((sorted(packages), sys.executable, tuple(sys.version_info)))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def stamp_matches(key):
+    """Check if the dependency stamp was written for the given key."""
+    try:
+        with open(DEPS_STAMP) as f:
+            return f.read() == key
+    except OSError:
+        return False
+
+
+def write_stamp(key):
+    """Atomically record that the dependencies for key are installed."""
+    try:
+        os.makedirs(os.path.dirname(DEPS_STAMP), exist_ok=True)
+        temp_path = DEPS_STAMP + ".tmp"
+        with open(temp_path, "w") as f:
+            f.write(key)
+        os.replace(temp_path, DEPS_STAMP)
+    except OSError as e:
+        print(f"Warning: Could not write dependency stamp: {e}")
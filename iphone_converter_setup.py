@@ -8,17 +8,30 @@ import sys
 import platform
 import subprocess
 import shutil
-import tempfile
+import hashlib
+import importlib.metadata
+import json
 import urllib.request
 import time
 import argparse
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _deps import CORE, platform_packages, dependencies_key, stamp_matches, write_stamp
+
 # Constants
+SYSTEM = platform.system()
+PYTHON = sys.executable
 PYTHON_VERSION = "3.10.0"
 WINDOWS_PYTHON_URL = f"https://www.python.org/ftp/python/{PYTHON_VERSION}/python-{PYTHON_VERSION}-amd64.exe"
 APP_NAME = "iPhone Photo Converter"
 APP_VERSION = "1.0.0"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "iphone_photo_converter")
+PYTHON_INSTALLER_PATH = os.path.join(CACHE_DIR, "python_installer.exe")
+# Prefer wheels and skip byte-compiling so installs don't build or compile anything
+PIP_INSTALL_ARGS = ["install", "--prefer-binary", "--no-compile", "--disable-pip-version-check"]
 
 def print_header(title):
     """Print a formatted header."""
@@ -26,96 +39,176 @@ def print_header(title):
     print(f" {title} ".center(60, "="))
     print("=" * 60 + "\n")
 
+@functools.lru_cache(maxsize=None)
 def is_python_installed():
     """Check if Python is installed and accessible."""
+    return shutil.which("python" if SYSTEM == "Windows" else "python3") is not None
+
+# Resolved pip install plans, keyed by a hash of the requested packages
+_install_plans = {}
+
+def _plan_key(packages):
+    return hashlib.sha256(repr(sorted(packages)).encode()).hexdigest()
+
+def plan_install(packages):
+    """Ask pip which distributions still need to be installed for packages.
+
+    Returns the resolved closure pinned as "name==version", or None if pip
+    cannot produce a report (pip older than 22.2).
+    """
+    key = _plan_key(packages)
+    if key not in _install_plans:
+        result = subprocess.run([PYTHON, "-m", "pip", *PIP_INSTALL_ARGS, "--dry-run", "--quiet",
+                                 "--report", "-", *packages],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        try:
+            report = json.loads(result.stdout)
+        except ValueError:
+            return None
+        _install_plans[key] = [f"{item['metadata']['name']}=={item['metadata']['version']}"
+                               for item in report.get("install", [])]
+    return _install_plans[key]
+
+def pip_install(packages):
+    """Install packages with a single pip process.
+
+    Only the distributions pip's resolver says are missing or outdated are
+    installed. pip doesn't support several installs into one environment at
+    once, so everything goes through one run. Raises
+    subprocess.CalledProcessError if pip fails.
+    """
+    key = _plan_key(packages)
+    planned = plan_install(packages)
+    install_args = PIP_INSTALL_ARGS
+    if planned is not None:
+        if not planned:
+            print("Already installed: " + ", ".join(packages))
+            return
+        # The plan is the full pinned closure, so pip needn't resolve it again
+        packages = planned
+        install_args = PIP_INSTALL_ARGS + ["--no-deps"]
+    
     try:
-        if platform.system() == "Windows":
-            result = subprocess.run(["where", "python"], 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE)
-            return result.returncode == 0
-        else:
-            result = subprocess.run(["which", "python3"], 
-                                   stdout=subprocess.PIPE, 
-                                   stderr=subprocess.PIPE)
-            return result.returncode == 0
-    except:
-        return False
+        subprocess.run([PYTHON, "-m", "pip", *install_args,
+                        "--only-binary=:all:", *packages], check=True)
+    except subprocess.CalledProcessError:
+        # Some packages may have no wheel for this platform
+        print(f"Retrying {', '.join(packages)} with source builds allowed...")
+        subprocess.run([PYTHON, "-m", "pip", *install_args, *packages], check=True)
+    
+    # Nothing left to install for this package list
+    _install_plans[key] = []
 
 def install_dependencies():
     """Install required dependencies."""
     print("Installing dependencies...")
     
-    # Core dependencies for all platforms
-    core_dependencies = [
-        'pillow',
-        'pillow-heif',
-        'piexif',
-        'regex',
-        'pyqt6',
-    ]
+    core_dependencies = list(CORE)
+    platform_dependencies = list(platform_packages(SYSTEM))
     
-    # Install core dependencies first
-    try:
-        print("Installing core dependencies...")
-        if platform.system() == "Windows":
-            subprocess.run([sys.executable, "-m", "pip", "install", *core_dependencies], check=True)
-        else:
-            subprocess.run([sys.executable, "-m", "pip", "install", *core_dependencies], check=True)
-        print("Core dependencies installed successfully!")
-    except subprocess.CalledProcessError as e:
-        print(f"Error installing core dependencies: {e}")
-        print("You may need to install these manually: " + ", ".join(core_dependencies))
-        return False
+    # Nothing to do if the launcher or an earlier run already installed these
+    key = dependencies_key(core_dependencies + platform_dependencies)
+    if stamp_matches(key):
+        print("All dependencies are already installed!")
+        return True
     
-    # Platform-specific dependencies
+    # Install core and platform-specific dependencies with a single pip run;
+    # pip_install resolves the dry-run plan first, so only what's missing is installed
     try:
-        print("Installing platform-specific dependencies...")
-        if platform.system() == 'Darwin':  # macOS
-            # Using pyusb instead of pyobjc-framework-libusb which may be unavailable
-            macos_deps = ['pyusb']
-            subprocess.run([sys.executable, "-m", "pip", "install", *macos_deps], check=True)
-            print("Note: On macOS, you might need to install libusb with Homebrew:")
-            print("brew install libusb")
-        elif platform.system() == 'Windows':
-            windows_deps = ['pyusb', 'libusb-package', 'wmi']
-            subprocess.run([sys.executable, "-m", "pip", "install", *windows_deps], check=True)
-        else:  # Linux
-            linux_deps = ['pyusb']
-            subprocess.run([sys.executable, "-m", "pip", "install", *linux_deps], check=True)
-            print("Note: On Linux, you might need to install libusb development package:")
-            print("Ubuntu/Debian: sudo apt-get install libusb-1.0-0-dev")
-            print("Fedora: sudo dnf install libusb-devel")
-        
-        print("Platform-specific dependencies installed successfully!")
+        print("Installing core and platform-specific dependencies...")
+        pip_install(core_dependencies + platform_dependencies)
+        print("Dependencies installed successfully!")
+        write_stamp(key)
     except subprocess.CalledProcessError as e:
+        # Only the core dependencies are required, so find out whether they made it
+        try:
+            pip_install(core_dependencies)
+        except subprocess.CalledProcessError as e:
+            print(f"Error installing core dependencies: {e}")
+            print("You may need to install these manually: " + ", ".join(core_dependencies))
+            return False
         print(f"Warning: Some platform-specific dependencies could not be installed: {e}")
         print("This might affect USB device detection, but the application should still work for basic functionality.")
     
+    if SYSTEM == 'Darwin':  # macOS
+        print("Note: On macOS, you might need to install libusb with Homebrew:")
+        print("brew install libusb")
+    elif SYSTEM != 'Windows':  # Linux
+        print("Note: On Linux, you might need to install libusb development package:")
+        print("Ubuntu/Debian: sudo apt-get install libusb-1.0-0-dev")
+        print("Fedora: sudo dnf install libusb-devel")
+    
     return True
 
-def install_python_windows():
-    """Download and install Python on Windows."""
-    print("Python not found. Downloading and installing Python...")
+def download_python_installer(url, path):
+    """Download the Python installer, resuming a partial download and reusing
+    the cached copy if it is unchanged."""
+    etag_path = os.path.join(os.path.dirname(path), "installer.etag")
+    temp_path = path + ".part"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
     
-    # Create a temporary directory and download the installer
-    temp_dir = tempfile.mkdtemp()
-    installer_path = os.path.join(temp_dir, "python_installer.exe")
-    
-    print(f"Downloading Python installer from {WINDOWS_PYTHON_URL}...")
-    urllib.request.urlretrieve(WINDOWS_PYTHON_URL, installer_path)
+    try:
+        # Find out the size and version of the installer on the server
+        with urllib.request.urlopen(urllib.request.Request(url, method="HEAD")) as response:
+            total_size = int(response.headers.get("Content-Length", 0)) or None
+            etag = response.headers.get("ETag")
+        
+        if etag and os.path.exists(path) and os.path.exists(etag_path):
+            with open(etag_path) as f:
+                if f.read().strip() == etag:
+                    print("Cached Python installer is up to date.")
+                    return True
+        
+        # Pick up where an interrupted download left off
+        headers = {}
+        offset = os.path.getsize(temp_path) if os.path.exists(temp_path) else 0
+        if offset and total_size and offset < total_size:
+            print(f"Resuming download at {offset // (1 << 20)} MB...")
+            headers["Range"] = f"bytes={offset}-"
+            if etag:
+                # The server sends the whole file instead if it has changed
+                headers["If-Range"] = etag
+        
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:
+            mode = "ab" if response.status == 206 else "wb"
+            with open(temp_path, mode) as f:
+                shutil.copyfileobj(response, f, 1 << 20)
+        
+        # Keep the partial file around so the next attempt can resume it
+        size = os.path.getsize(temp_path)
+        if total_size and size != total_size:
+            print(f"Error: Download incomplete ({size} of {total_size} bytes). Please run setup again.")
+            return False
+        os.replace(temp_path, path)
+    except (OSError, ValueError) as e:
+        print(f"Error downloading Python installer: {e}")
+        return False
     
+    # Remember the ETag for next time
+    if etag:
+        with open(etag_path, "w") as f:
+            f.write(etag)
+    return True
+
+async def _fetch_python(url, path):
+    """Download the Python installer on a worker thread."""
+    print(f"Downloading Python installer from {url}...")
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, download_python_installer, url, path)
+
+def install_python_windows(installer_path):
+    """Install Python on Windows from a downloaded installer."""
     # Run the installer with required flags
     print("Running Python installer...")
     subprocess.run([installer_path, "/quiet", "InstallAllUsers=1", "PrependPath=1", "Include_test=0"])
     
-    # Clean up
-    shutil.rmtree(temp_dir)
-    
     print("Python installed successfully!")
     print("Please restart this script to continue setup.")
     
     # Verify installation
+    is_python_installed.cache_clear()
     if is_python_installed():
         return True
     else:
@@ -124,95 +217,79 @@ def install_python_windows():
 
 def install_python_guide():
     """Display guide for installing Python on non-Windows systems."""
-    system = platform.system()
-    
-    if system == "Darwin":  # macOS
+    if SYSTEM == "Darwin":  # macOS
         print("Python not found. Please install Python using one of these methods:")
         print("1. Download and install from https://www.python.org/downloads/")
         print("2. Install using Homebrew: brew install python")
         print("3. Install using MacPorts: port install python310")
-    elif system == "Linux":
+    elif SYSTEM == "Linux":
         print("Python 3 not found. Please install it using your distribution's package manager:")
         print("For Ubuntu/Debian: sudo apt-get update && sudo apt-get install python3 python3-pip")
         print("For Fedora: sudo dnf install python3 python3-pip")
         print("For Arch Linux: sudo pacman -S python python-pip")
     else:
-        print(f"Unsupported operating system: {system}")
+        print(f"Unsupported operating system: {SYSTEM}")
     
     print("\nAfter installing Python, run this script again.")
     return False
 
-def create_windows_launcher():
-    """Create a Windows .bat launcher."""
-    launcher_path = "iPhone_Photo_Converter.bat"
-    with open(launcher_path, "w") as f:
-        f.write('@echo off\n')
-        f.write('echo Starting iPhone Photo Converter...\n')
-        f.write('python iphone_photo_converter.py\n')
-        f.write('if errorlevel 1 (\n')
-        f.write('    echo Error running application. Please make sure Python is installed.\n')
-        f.write('    echo If Python is not installed, please run iphone_converter_setup.py first.\n')
-        f.write('    pause\n')
-        f.write(')\n')
-    
-    print(f"Created launcher: {launcher_path}")
-    return launcher_path
+WINDOWS_LAUNCHER_TEMPLATE = """\
+@echo off
+echo Starting iPhone Photo Converter...
+python iphone_photo_converter.py
+if errorlevel 1 (
+    echo Error running application. Please make sure Python is installed.
+    echo If Python is not installed, please run iphone_converter_setup.py first.
+    pause
+)
+"""
 
-def create_macos_launcher():
-    """Create a macOS .command launcher."""
-    launcher_path = "iPhone_Photo_Converter.command"
-    with open(launcher_path, "w") as f:
-        f.write('#!/bin/bash\n')
-        f.write('cd "$(dirname "$0")"\n')
-        f.write('echo "Starting iPhone Photo Converter..."\n')
-        f.write('python3 iphone_photo_converter.py\n')
-        f.write('if [ $? -ne 0 ]; then\n')
-        f.write('    echo "Error running application. Please make sure Python is installed."\n')
-        f.write('    echo "If Python is not installed, please run iphone_converter_setup.py first."\n')
-        f.write('    read -p "Press Enter to continue..."\n')
-        f.write('fi\n')
-    
-    # Make it executable
-    os.chmod(launcher_path, 0o755)
-    print(f"Created launcher: {launcher_path}")
-    return launcher_path
+SHELL_LAUNCHER_TEMPLATE = """\
+#!/bin/bash
+cd "$(dirname "$0")"
+echo "Starting iPhone Photo Converter..."
+python3 iphone_photo_converter.py
+if [ $? -ne 0 ]; then
+    echo "Error running application. Please make sure Python is installed."
+    echo "If Python is not installed, please run iphone_converter_setup.py first."
+    read -p "Press Enter to continue..."
+fi
+"""
+
+# Launcher file name, contents and whether it must be made executable, per platform
+LAUNCHERS = {
+    "Windows": ("iPhone_Photo_Converter.bat", WINDOWS_LAUNCHER_TEMPLATE, False),
+    "Darwin": ("iPhone_Photo_Converter.command", SHELL_LAUNCHER_TEMPLATE, True),
+    "Linux": ("iphone_photo_converter.sh", SHELL_LAUNCHER_TEMPLATE, True),
+}
 
-def create_linux_launcher():
-    """Create a Linux .sh launcher."""
-    launcher_path = "iphone_photo_converter.sh"
-    with open(launcher_path, "w") as f:
-        f.write('#!/bin/bash\n')
-        f.write('cd "$(dirname "$0")"\n')
-        f.write('echo "Starting iPhone Photo Converter..."\n')
-        f.write('python3 iphone_photo_converter.py\n')
-        f.write('if [ $? -ne 0 ]; then\n')
-        f.write('    echo "Error running application. Please make sure Python is installed."\n')
-        f.write('    echo "If Python is not installed, please run iphone_converter_setup.py first."\n')
-        f.write('    read -p "Press Enter to continue..."\n')
-        f.write('fi\n')
+def create_launcher():
+    """Create the launcher script for the current platform."""
+    launcher_path, template, executable = LAUNCHERS[SYSTEM]
+    Path(launcher_path).write_text(template)
     
-    # Make it executable
-    os.chmod(launcher_path, 0o755)
+    if executable:
+        os.chmod(launcher_path, 0o755)
     print(f"Created launcher: {launcher_path}")
     return launcher_path
 
+@functools.lru_cache(maxsize=None)
 def check_pyinstaller():
     """Check if PyInstaller is installed."""
     try:
-        subprocess.run([sys.executable, "-m", "PyInstaller", "--version"], 
-                     stdout=subprocess.PIPE, 
-                     stderr=subprocess.PIPE)
+        importlib.metadata.version("pyinstaller")
         return True
-    except:
+    except importlib.metadata.PackageNotFoundError:
         return False
 
 def install_pyinstaller():
     """Install PyInstaller."""
     print("Installing PyInstaller...")
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
+        pip_install(["pyinstaller"])
         
         # Verify installation
+        check_pyinstaller.cache_clear()
         if check_pyinstaller():
             print("PyInstaller installed successfully!")
             return True
@@ -231,11 +308,12 @@ def create_windows_exe():
     # Run PyInstaller
     try:
         subprocess.run([
-            sys.executable, "-m", "PyInstaller",
+            PYTHON, "-m", "PyInstaller",
             "--name=iPhone_Photo_Converter",
             "--onefile",
             "--windowed",
             "--add-data=README.md;.",
+            "--add-data=iphone_detect.ps1;.",
             "iphone_photo_converter.py"
         ], check=True)
         
@@ -260,7 +338,7 @@ def create_macos_app():
     # Run PyInstaller to create app bundle
     try:
         subprocess.run([
-            sys.executable, "-m", "PyInstaller",
+            PYTHON, "-m", "PyInstaller",
             "--name=iPhone Photo Converter",
             "--windowed",
             "--add-data=README.md:.",
@@ -281,7 +359,7 @@ def create_linux_executable():
     # Run PyInstaller
     try:
         subprocess.run([
-            sys.executable, "-m", "PyInstaller",
+            PYTHON, "-m", "PyInstaller",
             "--name=iphone-photo-converter",
             "--onefile",
             "--add-data=README.md:.",
@@ -321,41 +399,46 @@ def get_user_choice(prompt, options):
 
 def basic_setup():
     """Perform basic setup: check Python, install dependencies, and create launcher."""
+    return asyncio.run(_basic_setup_async())
+
+async def _basic_setup_async():
     print_header("Basic Setup")
     
     # Check if Python is installed
+    python_task = None
     if not is_python_installed():
-        system = platform.system()
-        if system == "Windows":
-            if not install_python_windows():
-                return False
+        if SYSTEM == "Windows":
+            print("Python not found. Downloading and installing Python...")
+            # Download the installer while dependencies are being installed
+            python_task = asyncio.create_task(_fetch_python(WINDOWS_PYTHON_URL, PYTHON_INSTALLER_PATH))
         else:
             if not install_python_guide():
                 return False
     
     # Install dependencies
-    if not install_dependencies():
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(None, install_dependencies):
         print("Warning: Some dependencies could not be installed.")
         print("The application may still work with limited functionality.")
     
+    if python_task:
+        if not await python_task:
+            return False
+        if not install_python_windows(PYTHON_INSTALLER_PATH):
+            return False
+    
     # Make the main script executable
-    system = platform.system()
-    if system != "Windows":
+    if SYSTEM != "Windows":
         try:
             os.chmod("iphone_photo_converter.py", 0o755)
         except:
             print("Warning: Could not make script executable. You may need to run: chmod +x iphone_photo_converter.py")
     
     # Create platform-specific launcher
-    if system == "Windows":
-        launcher = create_windows_launcher()
-    elif system == "Darwin":  # macOS
-        launcher = create_macos_launcher()
-    elif system == "Linux":
-        launcher = create_linux_launcher()
-    else:
-        print(f"Unsupported operating system: {system}")
+    if SYSTEM not in LAUNCHERS:
+        print(f"Unsupported operating system: {SYSTEM}")
         return False
+    launcher = create_launcher()
     
     print(f"\nBasic setup completed successfully!")
     print(f"You can now run the application using: {launcher}")
@@ -371,15 +454,14 @@ def advanced_setup():
             return False
     
     # Create platform-specific executable
-    system = platform.system()
-    if system == "Windows":
+    if SYSTEM == "Windows":
         executable = create_windows_exe()
-    elif system == "Darwin":  # macOS
+    elif SYSTEM == "Darwin":  # macOS
         executable = create_macos_app()
-    elif system == "Linux":
+    elif SYSTEM == "Linux":
         executable = create_linux_executable()
     else:
-        print(f"Unsupported operating system: {system}")
+        print(f"Unsupported operating system: {SYSTEM}")
         return False
     
     if executable:
@@ -389,6 +471,23 @@ def advanced_setup():
     else:
         return False
 
+def prewarm_pyinstaller(executor):
+    """Load PyInstaller in a background process so the build starts with a warm cache."""
+    if check_pyinstaller():
+        return executor.submit(subprocess.run, [PYTHON, "-m", "PyInstaller", "--help"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return None
+
+def complete_setup(stop_on_failure=False):
+    """Perform basic setup followed by creating the standalone executable."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # PyInstaller's import is slow when cold; overlap it with the dependency install
+        prewarm_pyinstaller(executor)
+        basic_ok = basic_setup()
+    
+    if basic_ok or not stop_on_failure:
+        advanced_setup()
+
 def main():
     """Main function for the setup script."""
     parser = argparse.ArgumentParser(description=f"{APP_NAME} Setup")
@@ -399,7 +498,7 @@ def main():
 
     print_header(f"Welcome to {APP_NAME} Setup")
     print(f"Version: {APP_VERSION}")
-    print(f"Platform: {platform.system()} {platform.release()}")
+    print(f"Platform: {SYSTEM} {platform.release()}")
     
     # Handle command-line arguments
     if args.basic:
@@ -407,8 +506,7 @@ def main():
     elif args.advanced:
         advanced_setup()
     elif args.all:
-        basic_setup()
-        advanced_setup()
+        complete_setup()
     else:
         # Interactive mode
         options = ["Basic setup (Python, dependencies, and launcher)", 
@@ -423,8 +521,7 @@ def main():
         elif choice == 2:
             advanced_setup()
         elif choice == 3:
-            if basic_setup():
-                advanced_setup()
+            complete_setup(stop_on_failure=True)
         elif choice == 4:
             print("Exiting setup.")
             return
@@ -0,0 +1,6 @@
+# Lists the Apple PnP devices for iphone_photo_converter.py, one "PNP:<name>|<status>" line each.
+# The removable drives themselves are checked in Python.
+$ErrorActionPreference = "SilentlyContinue"
+Get-PnpDevice | Where-Object {$_.FriendlyName -like "*iPhone*" -or $_.FriendlyName -like "*Apple*"} | ForEach-Object {
+    Write-Output "PNP:$($_.FriendlyName)|$($_.Status)"
+}
@@ -4,24 +4,284 @@ import sys
 import shutil
 import platform
 import subprocess
-from datetime import datetime
 from pathlib import Path
-from PIL import Image, ExifTags
-from pillow_heif import register_heif_opener
-import piexif
 import re
+import struct
+import plistlib
+import ctypes
+import ctypes.util
+import time
 import threading
-import usb.core
-import usb.util
+import multiprocessing
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                            QWidget, QLabel, QProgressBar, QFileDialog, QMessageBox, QInputDialog)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
-
-# Register HEIF opener
-register_heif_opener()
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 
 # Constants
+SYSTEM = platform.system()
 APPLE_VENDOR_ID = 0x05ac  # Apple's USB vendor ID
+COPYFILE_ALL = 0xF  # copyfile(3) flags: ACL, stat, xattr and data
+DRIVE_REMOVABLE = 2  # GetDriveTypeW result for removable media
+EXIF_ORIENTATION_TAG = 0x0112
+APPLE_FOLDER_RE = re.compile(r'\d{3}APPLE\Z')  # DCIM subfolders like 100APPLE
+MAX_OUTPUT_SIZE = None  # (width, height) to shrink converted JPEGs to, or None for full resolution
+HEIF_DECODER = "ffmpeg"  # libheif decoder plugin to prefer when installed; libheif picks its default otherwise
+MEDIA_EXTENSIONS = frozenset({'.heic', '.jpg', '.jpeg', '.png', '.mov', '.mp4'})  # Files copied from the iPhone
+PHOTO_COUNT_LIMIT = 500  # Stop counting photos after detection here
+LINUX_DEVICE_FSTYPES = frozenset({'fuse.gvfsd-fuse', 'fuse.ifuse', 'fuse.mtpfs', 'fuse.jmtpfs', 'fuse.simple-mtpfs'})  # Phone mounts
+IPHONE_NAME_RE = re.compile(r'iphone|apple|ios|mtp|\Aiph', re.IGNORECASE)  # Mount names that look like an iPhone
+MOUNT_ESCAPE_RE = re.compile(r'\\([0-7]{3})')  # Octal escapes in /proc/mounts fields
+
+# PowerShell script listing Apple PnP devices, shipped next to this file (or unpacked with a frozen build)
+WINDOWS_DEVICE_SCAN_SCRIPT = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))),
+                                          "iphone_detect.ps1")
+WINDOWS_DEVICE_SCAN_COMMAND = ["powershell", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass",
+                               "-File", WINDOWS_DEVICE_SCAN_SCRIPT]
+
+# Native copy routines
+if sys.platform == "darwin":
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+elif sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+# One reusable copy buffer per copying thread
+_copy_buffers = threading.local()
+
+def _copy_buffered(src, dst):
+    """Copy a file through a reused 1 MiB buffer instead of allocating one per chunk."""
+    buffer = getattr(_copy_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _copy_buffers.buffer = memoryview(bytearray(1 << 20))
+    
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        while True:
+            read = fsrc.readinto(buffer)
+            if not read:
+                break
+            fdst.write(buffer[:read])
+
+def _fast_copy(src, dst):
+    """Copy a file inside the kernel where the platform supports it, falling
+    back to a buffered copy, and keep the source's timestamps."""
+    try:
+        if sys.platform.startswith("linux"):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                # Let the kernel read ahead aggressively so reads from the phone stay in flight
+                os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                try:
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                        pass
+                except OSError:
+                    # Older kernels refuse copy_file_range across filesystems, but sendfile still works
+                    fdst.seek(0)
+                    fdst.truncate()
+                    offset = 0
+                    while True:
+                        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, 1 << 30)
+                        if not sent:
+                            break
+                        offset += sent
+                # Some filesystems report EOF early instead of failing
+                if os.fstat(fdst.fileno()).st_size != os.fstat(fsrc.fileno()).st_size:
+                    raise OSError(f"Short copy of {src}")
+        elif sys.platform == "darwin":
+            if _libc.copyfile(os.fsencode(src), os.fsencode(dst), None, COPYFILE_ALL) != 0:
+                raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()), src)
+        elif sys.platform == "win32":
+            if not _kernel32.CopyFileW(src, dst, False):
+                raise ctypes.WinError(ctypes.get_last_error())
+        else:
+            _copy_buffered(src, dst)
+    except OSError:
+        _copy_buffered(src, dst)
+    
+    stat = os.stat(src)
+    os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+def _removable_drives():
+    """List the root paths of the removable drives on Windows, like 'E:\\'."""
+    size = _kernel32.GetLogicalDriveStringsW(0, None)
+    buffer = ctypes.create_unicode_buffer(size)
+    size = _kernel32.GetLogicalDriveStringsW(size, buffer)
+    drives = buffer[:size].split('\0')
+    return [drive for drive in drives if drive and _kernel32.GetDriveTypeW(drive) == DRIVE_REMOVABLE]
+
+def _find_dcim_entry(parent):
+    """Get the DirEntry of the DCIM folder directly inside parent, or None."""
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                if entry.name.upper() == "DCIM" and entry.is_dir(follow_symlinks=False):
+                    return entry
+    except OSError:
+        pass
+    return None
+
+def _find_dcim(parent):
+    """Get the DCIM folder directly inside parent, or None if there isn't one."""
+    entry = _find_dcim_entry(parent)
+    return entry.path if entry else None
+
+def _iter_media(root):
+    """Yield the paths of the media files under root.
+
+    Uses os.scandir so file types come from the directory listing rather than
+    an extra stat per entry, which is slow on MTP and FUSE mounts.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (entry.is_file(follow_symlinks=False)
+                          and os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS):
+                        yield entry.path
+        except OSError:
+            continue
+
+def _reset_orientation(exif):
+    """Return a copy of an EXIF block with its Orientation tag set to 1.
+
+    libheif already applies the rotation when decoding, so the tag has to say
+    the pixels are upright. The two bytes are patched in place rather than
+    rebuilding the whole block.
+    """
+    if not exif.startswith(b"Exif\x00\x00"):
+        exif = b"Exif\x00\x00" + exif
+    data = bytearray(exif)
+    
+    # TIFF header: byte order, magic number, then the offset of IFD0
+    tiff_start = 6
+    byte_order = {b"II": "<", b"MM": ">"}.get(bytes(data[tiff_start:tiff_start + 2]))
+    if byte_order is None:
+        raise ValueError("Invalid TIFF header in EXIF data")
+    ifd0 = tiff_start + struct.unpack_from(byte_order + "I", data, tiff_start + 4)[0]
+    
+    # Each IFD entry is 12 bytes: tag, type, count, value/offset
+    entry_count = struct.unpack_from(byte_order + "H", data, ifd0)[0]
+    for i in range(entry_count):
+        entry = ifd0 + 2 + i * 12
+        tag, value_type = struct.unpack_from(byte_order + "HH", data, entry)
+        if tag == EXIF_ORIENTATION_TAG and value_type == 3:  # SHORT, stored inline
+            struct.pack_into(byte_order + "H", data, entry + 8, 1)
+            break
+    
+    return bytes(data)
+
+def _encode_simplejpeg(pixels, mode, exif_bytes):
+    """Encode an RGB or RGBA pixel buffer with libjpeg-turbo through simplejpeg.
+
+    pixels can be anything exposing the array interface, such as a PIL image
+    or a pillow_heif HeifFile. Returns None if simplejpeg isn't installed or
+    can't encode the buffer, so the caller can fall back to Pillow.
+    """
+    # An APP1 segment can't hold more than this
+    if mode not in ("RGB", "RGBA") or (exif_bytes and len(exif_bytes) > 65533):
+        return None
+    try:
+        # Optional: faster JPEG encoding through libjpeg-turbo's own API
+        import numpy
+        import simplejpeg
+    except ImportError:
+        return None
+    try:
+        # Rows may be padded, and simplejpeg wants a contiguous array
+        array = numpy.ascontiguousarray(numpy.asarray(pixels))
+        jpeg_data = simplejpeg.encode_jpeg(array, quality=90, colorspace=mode,
+                                           colorsubsampling="420", fastdct=True)
+    except Exception:
+        return None
+    
+    if exif_bytes:
+        # Put the EXIF APP1 segment right after the SOI marker
+        jpeg_data = (jpeg_data[:2] + b"\xff\xe1" + struct.pack(">H", len(exif_bytes) + 2)
+                     + exif_bytes + jpeg_data[2:])
+    return jpeg_data
+
+def _init_converter():
+    """Set up a conversion worker process."""
+    import pillow_heif
+    
+    # libheif's FFmpeg plugin decodes HEVC through libavcodec, which is faster than
+    # libde265 and can use hardware decoders. This is only a preference, so builds
+    # without the plugin keep working.
+    if HEIF_DECODER and hasattr(pillow_heif.options, "PREFERRED_DECODER"):
+        pillow_heif.options.PREFERRED_DECODER["HEIF"] = HEIF_DECODER
+
+def _convert_one(file_path):
+    """Convert one HEIC file to a JPEG alongside it.
+
+    Kept at module level so it can be run in a worker process.
+    """
+    # Imaging libraries are only needed here, in the worker processes
+    from pillow_heif import open_heif
+    
+    filename = os.path.basename(file_path)
+    jpeg_path = os.path.splitext(file_path)[0] + ".jpg"
+    
+    # Skip files converted by an earlier transfer; copies keep the HEIC's original mtime
+    try:
+        if os.stat(jpeg_path).st_mtime >= os.stat(file_path).st_mtime:
+            return jpeg_path
+    except FileNotFoundError:
+        pass
+    
+    heif_file = open_heif(file_path)
+    
+    # Get exif data if available
+    exif_raw = heif_file.info.get("exif")
+    exif_bytes = None
+    
+    if exif_raw:
+        # Update exif data with orientation; everything else, DateTime included, is kept as is
+        try:
+            exif_bytes = _reset_orientation(exif_raw)
+        except Exception as e:
+            print(f"Error processing EXIF for {filename}: {e}")
+    
+    # Save image as jpeg, writing to a temporary name so an interrupted save never looks finished
+    temp_path = jpeg_path + ".part"
+    
+    # At full size libheif's decoded buffer can go straight to libjpeg-turbo, with no PIL image in between
+    jpeg_data = None if MAX_OUTPUT_SIZE else _encode_simplejpeg(heif_file, heif_file.mode, exif_bytes)
+    if jpeg_data is not None:
+        with open(temp_path, "wb") as f:
+            f.write(jpeg_data)
+    else:
+        from PIL import Image
+        
+        # Wrap libheif's pixel buffer without a PIL plugin pass
+        image = Image.frombytes(heif_file.mode, heif_file.size, heif_file.data,
+                                "raw", heif_file.mode, heif_file.stride)
+        # frombytes copied the pixels, so free libheif's decoded buffer before encoding
+        del heif_file
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        if MAX_OUTPUT_SIZE:
+            # reducing_gap does most of the shrink with a cheap integer reduce() before resampling
+            image.thumbnail(MAX_OUTPUT_SIZE, reducing_gap=2.0)
+        
+        # A resized image hasn't been offered to simplejpeg yet
+        jpeg_data = _encode_simplejpeg(image, image.mode, exif_bytes) if MAX_OUTPUT_SIZE else None
+        if jpeg_data is not None:
+            with open(temp_path, "wb") as f:
+                f.write(jpeg_data)
+        else:
+            # libjpeg converts RGB to YCbCr itself while encoding, so no separate color pass is needed
+            save_options = {"quality": 90, "subsampling": "4:2:0", "optimize": False, "progressive": False}
+            
+            # Save with exif if available, otherwise save without
+            if exif_bytes:
+                save_options["exif"] = exif_bytes
+            image.save(temp_path, "jpeg", **save_options)
+    os.replace(temp_path, jpeg_path)
+    
+    return jpeg_path
 
 class WorkerThread(QThread):
     progress_updated = pyqtSignal(int)
@@ -33,110 +293,172 @@ class WorkerThread(QThread):
         self.source_path = source_path
         self.target_path = target_path
         self.running = True
+        # Joined once; every copied file goes straight into this folder
+        self._target_prefix = os.path.join(target_path, "")
+        self._progress_lock = threading.Lock()
+        self._done_steps = 0
+        self._total_steps = 0
+        self._last_progress = -1
+        self._last_progress_time = 0.0
+        self._conversions = []
         
     def run(self):
         try:
-            self.status_updated.emit("Finding and copying files...")
-            self.copy_files_from_iphone()
-            
-            self.status_updated.emit("Converting HEIC files to JPEG...")
-            self.convert_heic_files()
+            # Convert HEIC files while the rest are still being copied
+            # Spawn rather than fork: the pool starts while copier, Qt and GUI threads are running.
+            # Windows can't wait on more than 61 worker processes.
+            with ProcessPoolExecutor(max_workers=min(61, os.cpu_count() or 1), initializer=_init_converter,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                self.status_updated.emit("Finding, copying and converting files...")
+                conversions = self.copy_files_from_iphone(executor)
+                
+                self.status_updated.emit("Converting HEIC files to JPEG...")
+                self.convert_heic_files(conversions)
             
             self.status_updated.emit("Process completed successfully!")
             self.finished_signal.emit()
         except Exception as e:
             self.status_updated.emit(f"Error: {str(e)}")
     
-    def copy_files_from_iphone(self):
+    def _advance_progress(self):
+        """Count one finished copy or conversion towards the progress bar."""
+        with self._progress_lock:
+            self._done_steps += 1
+            progress = int(self._done_steps / self._total_steps * 100)
+            # Only cross to the GUI thread when the bar would actually move,
+            # at most every 50 ms, but always show completion
+            now = time.monotonic()
+            if progress == self._last_progress:
+                return
+            if progress < 100 and now - self._last_progress_time < 0.05:
+                return
+            self._last_progress = progress
+            self._last_progress_time = now
+        self.progress_updated.emit(progress)
+    
+    def _on_converted(self, file_name, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            print(f"Error converting {file_name}: {error}")
+        self._advance_progress()
+    
+    def copy_files_from_iphone(self, executor):
+        """Copy the media files, handing each HEIC file to the executor as soon
+        as it lands. Returns the conversion futures."""
         # Ensure target directory exists
         os.makedirs(self.target_path, exist_ok=True)
         
         # Get all files from source
-        files = []
-        for root, _, filenames in os.walk(self.source_path):
-            for filename in filenames:
-                if filename.lower().endswith(('.heic', '.jpg', '.jpeg', '.png', '.mov', '.mp4')):
-                    files.append(os.path.join(root, filename))
-        
-        # Copy files with progress updates
-        total_files = len(files)
-        for i, file_path in enumerate(files):
-            if not self.running:
-                return
-                
-            try:
-                file_name = os.path.basename(file_path)
-                dest_path = os.path.join(self.target_path, file_name)
-                shutil.copy2(file_path, dest_path)
-                
-                # Update progress
-                progress = int((i + 1) / total_files * 50)  # First 50% for copying
-                self.progress_updated.emit(progress)
-            except Exception as e:
-                print(f"Error copying {file_path}: {e}")
-    
-    def convert_heic_files(self):
-        heic_files = [f for f in os.listdir(self.target_path) 
-                     if os.path.isfile(os.path.join(self.target_path, f))
-                     and f.lower().endswith(('.heic'))]
-        
-        total_files = len(heic_files)
-        if total_files == 0:
+        files = list(_iter_media(self.source_path))
+        
+        # Note which files need converting once, rather than re-checking names later.
+        # A HEIC file that the phone also stores as a JPEG in the same folder doesn't
+        # need decoding at all, and converting it would overwrite that JPEG.
+        jpeg_stems = set()
+        heic_stems = []
+        for f in files:
+            # Split and lowercase each name once
+            folder, name = os.path.split(f)
+            stem, ext = os.path.splitext(name.lower())
+            if ext == '.heic':
+                heic_stems.append((f, (folder, stem)))
+            elif ext in ('.jpg', '.jpeg'):
+                jpeg_stems.add((folder, stem))
+        heic_files = {f for f, key in heic_stems if key not in jpeg_stems}
+        
+        # Copies run in parallel, so every file needs its own destination before any starts
+        destinations = self._plan_destinations(files, heic_files)
+        
+        # One step per copy plus one per HEIC conversion
+        self._total_steps = len(files) + len(heic_files)
+        
+        # Copy several files at once so the USB link isn't idle between reads
+        copy_workers = min(8, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=copy_workers) as copier:
+            copies = [copier.submit(self._copy_one, file_path, destinations[file_path],
+                                    file_path in heic_files, executor)
+                      for file_path in files]
+        # Surface anything _copy_one didn't handle rather than dropping it silently
+        for future in copies:
+            future.result()
+        
+        return self._conversions
+    
+    def _plan_destinations(self, files, heic_files):
+        """Pick a distinct destination path for every file.
+
+        iPhones reuse names like IMG_0001.MOV once their counter wraps, so a
+        clashing name gets a " (n)" suffix. A HEIC file that will be converted
+        also claims the .jpg name its conversion writes. Names are compared
+        case-insensitively for the benefit of Windows and macOS.
+        """
+        taken = set()
+        destinations = {}
+        for file_path in files:
+            stem, ext = os.path.splitext(os.path.basename(file_path))
+            suffix = 0
+            while True:
+                name = f"{stem} ({suffix}){ext}" if suffix else stem + ext
+                names = {name.lower()}
+                if file_path in heic_files:
+                    names.add(os.path.splitext(name)[0].lower() + ".jpg")
+                if taken.isdisjoint(names):
+                    break
+                suffix += 1
+            taken.update(names)
+            destinations[file_path] = self._target_prefix + name
+        return destinations
+    
+    def _copy_one(self, file_path, dest_path, is_heic, executor):
+        """Copy one file with progress updates, queueing its conversion if it is a HEIC file."""
+        if not self.running:
             return
-            
-        for i, filename in enumerate(heic_files):
+        
+        try:
+            file_name = os.path.basename(dest_path)
+            _fast_copy(file_path, dest_path)
+        except Exception as e:
+            print(f"Error copying {file_path}: {e}")
+            if is_heic:
+                # Its conversion will never run, so count it as done
+                self._advance_progress()
+            return
+        finally:
+            self._advance_progress()
+        
+        if is_heic and self.running:
+            try:
+                future = executor.submit(_convert_one, dest_path)
+            except RuntimeError as e:
+                # Covers BrokenProcessPool too; the conversion won't run, so count it as done
+                print(f"Error queueing conversion for {file_name}: {e}")
+                self._advance_progress()
+                return
+            future.add_done_callback(lambda f, name=file_name: self._on_converted(name, f))
+            self._conversions.append(future)
+    
+    def convert_heic_files(self, conversions):
+        """Wait for the conversions still running after the copy finished."""
+        for future in as_completed(conversions):
             if not self.running:
                 return
-                
-            try:
-                file_path = os.path.join(self.target_path, filename)
-                image = Image.open(file_path)
-                
-                # Get exif data if available
-                image_exif = image.getexif()
-                exif_bytes = None
-                
-                if image_exif:
-                    # Make a map with tag names
-                    exif = {ExifTags.TAGS[k]: v for k, v in image_exif.items() 
-                           if k in ExifTags.TAGS and type(v) is not bytes}
-                    
-                    # Load exif data via piexif
-                    try:
-                        exif_dict = piexif.load(image.info.get("exif", b''))
-                        
-                        # Update exif data with orientation
-                        exif_dict["0th"][piexif.ImageIFD.Orientation] = 1
-                        
-                        # Add datetime if available
-                        if 'DateTime' in exif:
-                            date = datetime.strptime(exif['DateTime'], '%Y:%m:%d %H:%M:%S')
-                            exif_dict["0th"][piexif.ImageIFD.DateTime] = date.strftime("%Y:%m:%d %H:%M:%S")
-                            
-                        exif_bytes = piexif.dump(exif_dict)
-                    except Exception as e:
-                        print(f"Error processing EXIF for {filename}: {e}")
-                
-                # Save image as jpeg
-                jpeg_path = os.path.join(self.target_path, os.path.splitext(filename)[0] + ".jpg")
-                
-                # Save with exif if available, otherwise save without
-                if exif_bytes:
-                    image.save(jpeg_path, "jpeg", exif=exif_bytes)
-                else:
-                    image.save(jpeg_path, "jpeg")
-                
-                # Update progress (from 50% to 100%)
-                progress = 50 + int((i + 1) / total_files * 50)
-                self.progress_updated.emit(progress)
-                
-            except Exception as e:
-                print(f"Error converting {filename}: {e}")
     
     def stop(self):
         self.running = False
+        # Drop queued conversions right away instead of when the next one finishes
+        for future in list(self._conversions):
+            future.cancel()
 
 class PhotoConverterApp(QMainWindow):
+    # UI updates from any thread; queued onto the GUI thread when emitted elsewhere
+    status_changed = pyqtSignal(str)
+    progress_changed = pyqtSignal(int)
+    transfer_enabled_changed = pyqtSignal(bool)
+    retry_visible_changed = pyqtSignal(bool)
+    retry_attempt_scheduled = pyqtSignal(int)
+    
     def __init__(self):
         super().__init__()
         
@@ -151,11 +473,13 @@ class PhotoConverterApp(QMainWindow):
         
         # Labels and controls
         self.status_label = QLabel("Ready to transfer photos from iPhone")
+        self.status_changed.connect(self.status_label.setText)
         layout.addWidget(self.status_label)
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
+        self.progress_changed.connect(self.progress_bar.setValue)
         layout.addWidget(self.progress_bar)
         
         # Primary Controls
@@ -166,11 +490,14 @@ class PhotoConverterApp(QMainWindow):
         self.retry_button = QPushButton("🔄 Retry Detection")
         self.retry_button.clicked.connect(self.retry_detection)
         self.retry_button.setVisible(False)  # Hidden by default
+        self.retry_visible_changed.connect(self.retry_button.setVisible)
+        self.retry_attempt_scheduled.connect(self._schedule_retry_attempt)
         layout.addWidget(self.retry_button)
         
         self.transfer_button = QPushButton("📱➡️💻 Transfer and Convert Photos")
         self.transfer_button.clicked.connect(self.start_transfer)
         self.transfer_button.setEnabled(False)
+        self.transfer_enabled_changed.connect(self.transfer_button.setEnabled)
         layout.addWidget(self.transfer_button)
         
         self.select_output_button = QPushButton("📁 Select Output Folder")
@@ -203,6 +530,62 @@ class PhotoConverterApp(QMainWindow):
         self.output_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transferred_photos")
         self.update_status(f"Output folder: {self.output_folder}")
         self.worker_thread = None
+        self._subprocess_cache = {}
+        self._usb_snapshot = None
+        self._dcim_cache = {}  # DCIM path -> (mtime_ns, is_iphone)
+        self._itunes_present = None
+        
+        # Linux mount locations depend only on the user, so work them out once
+        self._uid = os.getuid() if hasattr(os, 'getuid') else 1000
+        self._user = os.environ.get("USER", "user")
+        self._gvfs_base = f"/run/user/{self._uid}/gvfs"
+        self._linux_scan_bases = (
+            self._gvfs_base,
+            f"/media/{self._user}",
+            "/media",
+            "/mnt",
+            "/tmp",
+            f"/home/{self._user}/.gvfs",
+        )
+    
+    def _start_detection_cycle(self):
+        """Forget cached system queries and USB devices so the next checks see fresh state."""
+        self._subprocess_cache.clear()
+        self._usb_snapshot = None
+    
+    def _apple_usb_devices(self):
+        """List the Apple USB devices, enumerating the bus once per detection cycle.
+
+        Raises if pyusb or its backend is unavailable, like usb.core.find.
+        """
+        if self._usb_snapshot is None:
+            import usb.core
+            self._usb_snapshot = list(usb.core.find(find_all=True, idVendor=APPLE_VENDOR_ID))
+        return self._usb_snapshot
+    
+    def _run_cached(self, cmd, ttl=5.0, **kwargs):
+        """Run a system query, reusing its result if the same command ran within
+        the last ttl seconds. The cache is cleared at the start of each detection
+        cycle, so the detection methods and diagnostics can share one run."""
+        text = kwargs.get("text", False)
+        cached = self._cached_run(cmd, ttl, text)
+        if cached is not None:
+            return cached
+        
+        result = subprocess.run(cmd, **kwargs)
+        self._store_run(cmd, result, text)
+        return result
+    
+    def _cached_run(self, cmd, ttl=5.0, text=False):
+        """Get the cached result of cmd if it ran within the last ttl seconds, else None."""
+        cached = self._subprocess_cache.get((tuple(cmd), text))
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+    
+    def _store_run(self, cmd, result, text=False):
+        """Cache the result of a command run outside _run_cached."""
+        self._subprocess_cache[(tuple(cmd), text)] = (time.monotonic(), result)
     
     def _provide_connection_help(self, system):
         """Provide system-specific help for iPhone connection issues."""
@@ -242,47 +625,58 @@ class PhotoConverterApp(QMainWindow):
         self.transfer_button.setEnabled(False)
         
         # Start detection with extra thoroughness
-        threading.Thread(target=self._enhanced_detection_worker, daemon=True).start()
+        self._start_retry_attempt(0)
+    
+    def _start_retry_attempt(self, attempt):
+        """Run one enhanced detection attempt on a background thread."""
+        # A folder judged not to be an iPhone's may have filled in since the last attempt
+        self._dcim_cache.clear()
+        threading.Thread(target=self._enhanced_detection_worker, args=(attempt,), daemon=True).start()
+    
+    def _schedule_retry_attempt(self, attempt):
+        # The pause between attempts is a Qt timer, so no thread sits sleeping
+        QTimer.singleShot(2000, lambda: self._start_retry_attempt(attempt))
     
-    def _enhanced_detection_worker(self):
-        """Enhanced detection worker with multiple retry attempts."""
+    def _enhanced_detection_worker(self, attempt):
+        """Enhanced detection worker; failed attempts schedule the next one, up to 3 in total."""
         try:
-            system = platform.system()
+            system = SYSTEM
             
-            for attempt in range(3):  # Try 3 times
-                self.update_status(f"🔍 Detection attempt {attempt + 1}/3...")
-                
-                if system == "Windows":
-                    self.iphone_path = self._find_iphone_windows()
-                elif system == "Darwin":
-                    self.iphone_path = self._find_iphone_macos()
-                elif system == "Linux":
-                    self.iphone_path = self._find_iphone_linux()
-                
-                if self.iphone_path:
-                    # Verify access
-                    try:
-                        test_files = os.listdir(self.iphone_path)
-                        file_count = len([f for f in test_files if os.path.isfile(os.path.join(self.iphone_path, f))])
-                        self.update_status(f"✅ iPhone found on attempt {attempt + 1}! Found {file_count} items in DCIM")
-                        self.transfer_button.setEnabled(True)
-                        return
-                    except Exception as e:
-                        self.update_status(f"Found iPhone but access denied: {str(e)}")
-                        self.iphone_path = None
-                
-                if attempt < 2:
-                    self.update_status(f"❌ Attempt {attempt + 1} failed, waiting 2 seconds...")
-                    threading.Event().wait(2)  # Wait 2 seconds between attempts
+            self.update_status(f"🔍 Detection attempt {attempt + 1}/3...")
+            self._start_detection_cycle()
+            
+            if system == "Windows":
+                self.iphone_path = self._find_iphone_windows()
+            elif system == "Darwin":
+                self.iphone_path = self._find_iphone_macos()
+            elif system == "Linux":
+                self.iphone_path = self._find_iphone_linux()
+            
+            if self.iphone_path:
+                # Verify access
+                try:
+                    with os.scandir(self.iphone_path) as entries:
+                        file_count = sum(1 for entry in entries if entry.is_file())
+                    self.update_status(f"✅ iPhone found on attempt {attempt + 1}! Found {file_count} items in DCIM")
+                    self.transfer_enabled_changed.emit(True)
+                    return
+                except Exception as e:
+                    self.update_status(f"Found iPhone but access denied: {str(e)}")
+                    self.iphone_path = None
+            
+            if attempt < 2:
+                self.update_status(f"❌ Attempt {attempt + 1} failed, waiting 2 seconds...")
+                self.retry_attempt_scheduled.emit(attempt + 1)
+                return
             
             # All attempts failed
             self.update_status("❌ All detection attempts failed.")
             self._provide_connection_help(system)
-            self.retry_button.setVisible(True)
+            self.retry_visible_changed.emit(True)
             
         except Exception as e:
             self.update_status(f"❌ Enhanced detection failed: {str(e)}")
-            self.retry_button.setVisible(True)
+            self.retry_visible_changed.emit(True)
     
     def toggle_advanced_options(self):
         """Toggle visibility of advanced options."""
@@ -306,13 +700,17 @@ class PhotoConverterApp(QMainWindow):
         self.progress_bar.setValue(0)
         self.retry_button.setVisible(False)
         
+        # An explicit detection request always rescans the device
+        self._dcim_cache.clear()
+        
         # Run in a separate thread to avoid UI blocking
         threading.Thread(target=self._comprehensive_detection_worker, daemon=True).start()
     
     def _comprehensive_detection_worker(self):
         """Comprehensive detection worker with built-in intelligence."""
+        self._start_detection_cycle()
         try:
-            system = platform.system()
+            system = SYSTEM
             self.update_status(f"🔍 Scanning {system} system for iPhone...")
             
             # First attempt with standard detection
@@ -329,29 +727,25 @@ class PhotoConverterApp(QMainWindow):
             if self.iphone_path:
                 # Verify we can actually access the path
                 try:
-                    test_files = os.listdir(self.iphone_path)
-                    file_count = len([f for f in test_files if os.path.isfile(os.path.join(self.iphone_path, f))])
+                    # Listing the folder fails if the iPhone is locked
+                    os.listdir(self.iphone_path)
                     
-                    # Count photo/video files specifically
-                    photo_count = 0
-                    for root, dirs, files in os.walk(self.iphone_path):
-                        for file in files:
-                            if file.lower().endswith(('.heic', '.jpg', '.jpeg', '.png', '.mov', '.mp4')):
-                                photo_count += 1
-                        if photo_count > 0:  # Don't scan everything if we found some
-                            break
+                    # Count photo/video files specifically, but stop early on large libraries
+                    photo_count = sum(1 for _ in islice(_iter_media(self.iphone_path), PHOTO_COUNT_LIMIT))
+                    if photo_count == PHOTO_COUNT_LIMIT:
+                        photo_count = f"{PHOTO_COUNT_LIMIT}+"
                     
                     self.update_status(f"🎉 iPhone detected successfully! Found {photo_count} photos/videos ready to transfer")
-                    self.transfer_button.setEnabled(True)
+                    self.transfer_enabled_changed.emit(True)
                     return
                     
                 except PermissionError:
                     self.update_status("📱 iPhone found but locked. Please unlock your iPhone and tap 'Trust This Computer', then try again.")
-                    self.retry_button.setVisible(True)
+                    self.retry_visible_changed.emit(True)
                     return
                 except Exception as e:
                     self.update_status(f"📱 iPhone found but cannot access files: {str(e)}")
-                    self.retry_button.setVisible(True)
+                    self.retry_visible_changed.emit(True)
                     return
             
             # If we get here, detection failed
@@ -365,13 +759,13 @@ class PhotoConverterApp(QMainWindow):
             elif system == "Linux":
                 self._check_linux_connection_issues()
             
-            self.retry_button.setVisible(True)
-            self.transfer_button.setEnabled(False)
+            self.retry_visible_changed.emit(True)
+            self.transfer_enabled_changed.emit(False)
                 
         except Exception as e:
             self.update_status(f"❌ Detection error: {str(e)}")
-            self.retry_button.setVisible(True)
-            self.transfer_button.setEnabled(False)
+            self.retry_visible_changed.emit(True)
+            self.transfer_enabled_changed.emit(False)
     
     def _check_windows_connection_issues(self):
         """Check for common Windows iPhone connection issues."""
@@ -379,8 +773,7 @@ class PhotoConverterApp(QMainWindow):
         
         # Check for Apple USB devices
         try:
-            devices = usb.core.find(find_all=True, idVendor=APPLE_VENDOR_ID)
-            apple_devices = list(devices)
+            apple_devices = self._apple_usb_devices()
             if not apple_devices:
                 issues.append("• No Apple USB devices detected - check USB cable connection")
             else:
@@ -389,14 +782,13 @@ class PhotoConverterApp(QMainWindow):
             issues.append("• Could not check USB devices")
         
         # Check for iTunes/Apple Mobile Device Support
-        try:
-            result = subprocess.run(["where", "iTunes"], capture_output=True, text=True)
-            if result.returncode != 0:
-                issues.append("• iTunes not found - install iTunes or Apple Mobile Device Support")
-            else:
-                issues.append("✅ iTunes detected")
-        except:
-            pass
+        if self._itunes_present is None:
+            # Same PATH lookup as `where iTunes`, without starting a process; installs don't change while the app runs
+            self._itunes_present = shutil.which("iTunes") is not None
+        if not self._itunes_present:
+            issues.append("• iTunes not found - install iTunes or Apple Mobile Device Support")
+        else:
+            issues.append("✅ iTunes detected")
         
         help_text = "❌ iPhone not found. Connection check results:\n\n" + "\n".join(issues)
         help_text += "\n\n💡 Try these solutions:\n"
@@ -439,7 +831,7 @@ class PhotoConverterApp(QMainWindow):
         
         # Check for lsusb
         try:
-            result = subprocess.run(["lsusb"], capture_output=True, text=True)
+            result = self._run_cached(["lsusb"], capture_output=True, text=True)
             if "Apple" in result.stdout:
                 issues.append("✅ Apple device detected by lsusb")
             else:
@@ -743,7 +1135,7 @@ class PhotoConverterApp(QMainWindow):
                     item = dcim_items.Item(i)
                     if item and item.Name:
                         # Check if this looks like an iPhone folder (e.g., 100APPLE)
-                        if re.match(r'^\d{3}APPLE$', item.Name):
+                        if APPLE_FOLDER_RE.match(item.Name):
                             return True
                         
                         # Or check if it's a folder that might contain photos
@@ -782,7 +1174,7 @@ class PhotoConverterApp(QMainWindow):
                 item_path = os.path.join(folder_path, item)
                 if os.path.isdir(item_path):
                     # Check for Apple folder pattern (100APPLE, 101APPLE, etc.)
-                    if re.match(r'^\d{3}APPLE$', item):
+                    if APPLE_FOLDER_RE.match(item):
                         return True
                     
                     # Check for photos inside any subfolder
@@ -812,8 +1204,9 @@ class PhotoConverterApp(QMainWindow):
     
     def _debug_detection_worker(self):
         """Worker thread for debug detection."""
+        self._start_detection_cycle()
         try:
-            system = platform.system()
+            system = SYSTEM
             debug_info = []
             debug_info.append(f"🐛 DEBUG DETECTION RESULTS ({system}):")
             debug_info.append("=" * 50)
@@ -827,7 +1220,7 @@ class PhotoConverterApp(QMainWindow):
             
             debug_text = "\n".join(debug_info)
             self.update_status(debug_text)
-            self.progress_bar.setValue(100)
+            self.progress_changed.emit(100)
             
         except Exception as e:
             self.update_status(f"❌ Debug detection failed: {str(e)}")
@@ -850,7 +1243,7 @@ class PhotoConverterApp(QMainWindow):
                     
                     # Try to get drive info
                     try:
-                        result = subprocess.run(
+                        result = self._run_cached(
                             ["wmic", "logicaldisk", "where", f"DeviceID='{drive}:'", "get", "DriveType,VolumeName"],
                             capture_output=True, text=True, timeout=5
                         )
@@ -899,15 +1292,12 @@ class PhotoConverterApp(QMainWindow):
         # Check PowerShell devices
         debug_info.append("\n⚡ CHECKING POWERSHELL DEVICES:")
         try:
-            result = subprocess.run(
-                ["powershell", "-Command", "Get-PnpDevice | Where-Object {$_.FriendlyName -like '*iPhone*' -or $_.FriendlyName -like '*Apple*'} | Select-Object FriendlyName, Status"],
-                capture_output=True, text=True, timeout=10
-            )
+            result = self._windows_device_scan()
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines[2:]:  # Skip headers
-                    if line.strip():
-                        debug_info.append(f"    📱 {line.strip()}")
+                for line in result.stdout.splitlines():
+                    if line.startswith("PNP:"):
+                        name, _, status = line[4:].partition("|")
+                        debug_info.append(f"    📱 {name} ({status})")
             else:
                 debug_info.append(f"  ❌ PowerShell error: {result.stderr}")
         except Exception as e:
@@ -916,8 +1306,7 @@ class PhotoConverterApp(QMainWindow):
         # Check USB devices
         debug_info.append("\n🔌 CHECKING USB DEVICES:")
         try:
-            devices = usb.core.find(find_all=True, idVendor=APPLE_VENDOR_ID)
-            apple_devices = list(devices)
+            apple_devices = self._apple_usb_devices()
             if apple_devices:
                 for device in apple_devices:
                     debug_info.append(f"    🍎 Apple USB Device: Vendor={hex(device.idVendor)}, Product={hex(device.idProduct)}")
@@ -940,7 +1329,7 @@ class PhotoConverterApp(QMainWindow):
                     if dcim_exists:
                         try:
                             dcim_contents = os.listdir(dcim_path)
-                            apple_folders = [f for f in dcim_contents if re.match(r'^\d{3}APPLE$', f)]
+                            apple_folders = [f for f in dcim_contents if APPLE_FOLDER_RE.match(f)]
                             debug_info.append(f"      📂 Apple folders: {apple_folders}")
                             if apple_folders:
                                 debug_info.append(f"      ✅ FOUND iPhone! Use this path: {dcim_path}")
@@ -1037,7 +1426,7 @@ class PhotoConverterApp(QMainWindow):
         # Check system_profiler
         debug_info.append("\n🔍 CHECKING system_profiler:")
         try:
-            result = subprocess.run(
+            result = self._run_cached(
                 ["system_profiler", "SPUSBDataType"],
                 capture_output=True, text=True, timeout=10
             )
@@ -1058,15 +1447,7 @@ class PhotoConverterApp(QMainWindow):
         debug_info = []
         
         # Check common mount points
-        user_id = os.getuid() if hasattr(os, 'getuid') else 1000
-        username = os.environ.get("USER", "user")
-        
-        paths_to_check = [
-            f"/run/user/{user_id}/gvfs",
-            f"/media/{username}",
-            "/media",
-            "/mnt"
-        ]
+        paths_to_check = self._linux_scan_bases[:4]
         
         debug_info.append("\n📁 CHECKING MOUNT POINTS:")
         for path in paths_to_check:
@@ -1082,7 +1463,7 @@ class PhotoConverterApp(QMainWindow):
         # Check lsusb
         debug_info.append("\n🔌 CHECKING lsusb:")
         try:
-            result = subprocess.run(["lsusb"], capture_output=True, text=True, timeout=5)
+            result = self._run_cached(["lsusb"], capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 apple_lines = [line for line in result.stdout.split('\n') if 'Apple' in line or 'iPhone' in line]
                 if apple_lines:
@@ -1105,39 +1486,30 @@ class PhotoConverterApp(QMainWindow):
     
     def _test_connection_worker(self):
         """Worker thread for testing iPhone connection."""
+        self._start_detection_cycle()
         try:
-            system = platform.system()
-            test_results = []
-            
-            # Test 1: USB Device Detection
-            self.update_status("Test 1/5: Checking USB device detection...")
-            usb_result = self._test_usb_detection()
-            test_results.append(f"USB Detection: {'✅ PASS' if usb_result else '❌ FAIL'}")
-            self.progress_bar.setValue(20)
-            
-            # Test 2: Platform-specific detection
-            self.update_status("Test 2/5: Platform-specific device detection...")
-            platform_result = self._test_platform_detection(system)
-            test_results.append(f"Platform Detection: {'✅ PASS' if platform_result else '❌ FAIL'}")
-            self.progress_bar.setValue(40)
-            
-            # Test 3: File system access
-            self.update_status("Test 3/5: Testing file system access...")
-            fs_result = self._test_filesystem_access()
-            test_results.append(f"File System Access: {'✅ PASS' if fs_result else '❌ FAIL'}")
-            self.progress_bar.setValue(60)
-            
-            # Test 4: DCIM folder structure
-            self.update_status("Test 4/5: Verifying DCIM folder structure...")
-            dcim_result = self._test_dcim_structure()
-            test_results.append(f"DCIM Structure: {'✅ PASS' if dcim_result else '❌ FAIL'}")
-            self.progress_bar.setValue(80)
-            
-            # Test 5: Photo file access
-            self.update_status("Test 5/5: Testing photo file access...")
-            photo_result = self._test_photo_access()
-            test_results.append(f"Photo Access: {'✅ PASS' if photo_result else '❌ FAIL'}")
-            self.progress_bar.setValue(100)
+            system = SYSTEM
+            
+            # The tests are independent, so run them side by side
+            tests = [
+                ("USB Detection", self._test_usb_detection, ()),
+                ("Platform Detection", self._test_platform_detection, (system,)),
+                ("File System Access", self._test_filesystem_access, ()),
+                ("DCIM Structure", self._test_dcim_structure, ()),
+                ("Photo Access", self._test_photo_access, ()),
+            ]
+            self.update_status(f"Running {len(tests)} connection tests...")
+            
+            results = {}
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = {executor.submit(test, *args): name for name, test, args in tests}
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    self.update_status(f"Connection tests: {done}/{len(tests)} finished...")
+                    self.progress_changed.emit(done * 100 // len(tests))
+            
+            # Report in the usual order regardless of which finished first
+            test_results = [f"{name}: {'✅ PASS' if results[name] else '❌ FAIL'}" for name, _, _ in tests]
             
             # Compile results
             passed_tests = sum(1 for result in test_results if '✅ PASS' in result)
@@ -1173,8 +1545,7 @@ class PhotoConverterApp(QMainWindow):
     def _test_usb_detection(self):
         """Test if iPhone is detected as a USB device."""
         try:
-            devices = usb.core.find(find_all=True, idVendor=APPLE_VENDOR_ID)
-            apple_devices = list(devices)
+            apple_devices = self._apple_usb_devices()
             return len(apple_devices) > 0
         except Exception as e:
             print(f"USB detection test failed: {e}")
@@ -1211,10 +1582,9 @@ class PhotoConverterApp(QMainWindow):
             if not self.iphone_path or not os.path.exists(self.iphone_path):
                 return False
             
-            items = os.listdir(self.iphone_path)
             # Look for typical iPhone folder patterns (like 100APPLE, 101APPLE, etc.)
-            apple_folders = [item for item in items if re.match(r'^\d{3}APPLE$', item)]
-            return len(apple_folders) > 0
+            with os.scandir(self.iphone_path) as entries:
+                return any(APPLE_FOLDER_RE.match(entry.name) for entry in entries)
         except Exception as e:
             print(f"DCIM structure test failed: {e}")
             return False
@@ -1225,17 +1595,16 @@ class PhotoConverterApp(QMainWindow):
             if not self.iphone_path or not os.path.exists(self.iphone_path):
                 return False
             
-            # Look for photo files in DCIM subfolders
-            for item in os.listdir(self.iphone_path):
-                item_path = os.path.join(self.iphone_path, item)
-                if os.path.isdir(item_path):
-                    try:
-                        files = os.listdir(item_path)
-                        photo_files = [f for f in files if f.lower().endswith(('.jpg', '.jpeg', '.heic', '.png'))]
-                        if photo_files:
-                            return True
-                    except:
-                        continue
+            # Look for photo files in DCIM subfolders, stopping at the first one
+            with os.scandir(self.iphone_path) as folders:
+                for folder in folders:
+                    if folder.is_dir():
+                        try:
+                            with os.scandir(folder.path) as files:
+                                if any(f.name.lower().endswith(('.jpg', '.jpeg', '.heic', '.png')) for f in files):
+                                    return True
+                        except OSError:
+                            continue
             return False
         except Exception as e:
             print(f"Photo access test failed: {e}")
@@ -1264,12 +1633,39 @@ class PhotoConverterApp(QMainWindow):
         # Check if any of the possible paths exist and contain DCIM
         for path in possible_paths:
             dcim_path = os.path.join(path, "DCIM")
-            if os.path.exists(dcim_path) and self._verify_iphone_device(path):
+            if self._verify_iphone_device(path):
                 return dcim_path
         
-        # Method 2: Use system_profiler to find connected iOS devices
+        # Method 2: Check user directories for iOS device mounts
+        try:
+            user_home = os.path.expanduser("~")
+            desktop_path = os.path.join(user_home, "Desktop")
+            
+            # Sometimes iOS devices appear as folders on desktop
+            if os.access(desktop_path, os.R_OK):
+                items = os.listdir(desktop_path)
+                for item in items:
+                    item_lower = item.lower()
+                    if ("iphone" in item_lower or "apple" in item_lower):
+                        item_path = os.path.join(desktop_path, item)
+                        if os.path.isdir(item_path):
+                            dcim_path = os.path.join(item_path, "DCIM")
+                            if os.path.exists(dcim_path):
+                                return dcim_path
+        except:
+            pass
+        
+        # The remaining methods shell out and can take seconds, so only run them
+        # when an Apple device is actually on the USB bus
+        try:
+            if not self._apple_usb_devices():
+                return None
+        except Exception:
+            pass  # No USB backend available; fall through to the slower checks
+        
+        # Method 3: Use system_profiler to find connected iOS devices
         try:
-            result = subprocess.run(
+            result = self._run_cached(
                 ["system_profiler", "SPUSBDataType", "-xml"],
                 capture_output=True, text=True, timeout=10
             )
@@ -1282,61 +1678,25 @@ class PhotoConverterApp(QMainWindow):
         except:
             pass
         
-        # Method 3: Use mdfind to search for iPhone-related content
-        try:
-            result = subprocess.run(["mdfind", "kMDItemKind == 'iPhone'"], 
-                                    capture_output=True, text=True, timeout=10)
-            paths = result.stdout.strip().split("\n")
-            for path in paths:
-                if path and os.path.exists(path):
-                    dcim_path = os.path.join(path, "DCIM")
-                    if os.path.exists(dcim_path):
-                        return dcim_path
-        except:
-            pass
-        
-        # Method 4: Check for iOS-style USB devices
+        # Method 4: Check mounted external disks, with mount points straight from diskutil's plist output
         try:
-            result = subprocess.run(
-                ["diskutil", "list"],
-                capture_output=True, text=True, timeout=10
+            result = self._run_cached(
+                ["diskutil", "list", "-plist", "external", "physical"],
+                capture_output=True, timeout=10
             )
             
             if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'iPhone' in line or 'Apple' in line:
-                        # Try to extract device identifier and find mount point
-                        parts = line.split()
-                        for part in parts:
-                            if part.startswith('/dev/disk'):
-                                mount_point = self._get_mount_point_macos(part)
-                                if mount_point:
-                                    dcim_path = os.path.join(mount_point, "DCIM")
-                                    if os.path.exists(dcim_path):
-                                        return dcim_path
-        except:
-            pass
-        
-        # Method 5: Check user directories for iOS device mounts
-        try:
-            user_home = os.path.expanduser("~")
-            desktop_path = os.path.join(user_home, "Desktop")
-            
-            # Sometimes iOS devices appear as folders on desktop
-            if os.path.exists(desktop_path):
-                items = os.listdir(desktop_path)
-                for item in items:
-                    item_lower = item.lower()
-                    if ("iphone" in item_lower or "apple" in item_lower):
-                        item_path = os.path.join(desktop_path, item)
-                        if os.path.isdir(item_path):
-                            dcim_path = os.path.join(item_path, "DCIM")
-                            if os.path.exists(dcim_path):
+                disks = plistlib.loads(result.stdout).get("AllDisksAndPartitions", [])
+                for disk in disks:
+                    for volume in [disk] + disk.get("Partitions", []):
+                        mount_point = volume.get("MountPoint")
+                        if mount_point:
+                            dcim_path = os.path.join(mount_point, "DCIM")
+                            if self._verify_iphone_device(mount_point):
                                 return dcim_path
         except:
             pass
-            
+        
         return None
     
     def _parse_system_profiler_for_iphone(self, xml_output):
@@ -1362,25 +1722,6 @@ class PhotoConverterApp(QMainWindow):
         
         return None
     
-    def _get_mount_point_macos(self, device_path):
-        """Get the mount point for a device path on macOS."""
-        try:
-            result = subprocess.run(
-                ["diskutil", "info", device_path],
-                capture_output=True, text=True, timeout=5
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'Mount Point:' in line:
-                        mount_point = line.split('Mount Point:')[1].strip()
-                        return mount_point
-        except:
-            pass
-        
-        return None
-    
     def _find_iphone_windows(self):
         """Enhanced iPhone detection for Windows with comprehensive automatic methods."""
         self.update_status("🔍 Scanning Windows drives and devices...")
@@ -1474,7 +1815,7 @@ class PhotoConverterApp(QMainWindow):
                 drive_path = f"{drive}:\\"
                 if os.path.exists(drive_path):
                     dcim_path = os.path.join(drive_path, "DCIM")
-                    if os.path.exists(dcim_path) and self._verify_iphone_device(drive_path):
+                    if self._verify_iphone_device(drive_path):
                         return dcim_path
             
             # Then use psutil for comprehensive scanning
@@ -1487,7 +1828,7 @@ class PhotoConverterApp(QMainWindow):
                     mount_point = partition.mountpoint
                     if mount_point and os.path.exists(mount_point):
                         dcim_path = os.path.join(mount_point, "DCIM")
-                        if os.path.exists(dcim_path) and self._verify_iphone_device(mount_point):
+                        if self._verify_iphone_device(mount_point):
                             return dcim_path
                         
                         # Check for nested iPhone structures
@@ -1526,7 +1867,7 @@ class PhotoConverterApp(QMainWindow):
             for drive in c.Win32_LogicalDisk():
                 if drive.DriveType == 2:  # Removable drive
                     dcim_path = os.path.join(drive.DeviceID, "DCIM")
-                    if os.path.exists(dcim_path) and self._verify_iphone_device(drive.DeviceID):
+                    if self._verify_iphone_device(drive.DeviceID):
                         return dcim_path
             
             # Check for Portable devices (MTP)
@@ -1548,46 +1889,65 @@ class PhotoConverterApp(QMainWindow):
             print(f"WMI detection failed: {e}")
             return None
     
+    def _windows_device_scan(self):
+        """Run the PowerShell device scan once per detection cycle.
+
+        Output lines are tagged "PNP:<name>|<status>" for Apple PnP devices.
+        """
+        return self._run_cached(WINDOWS_DEVICE_SCAN_COMMAND, capture_output=True, text=True, timeout=15)
+    
+    def _stream_windows_device_scan(self):
+        """Start the device scan and report whether it lists an Apple device.
+
+        Returns as soon as the first Apple device line arrives rather than when
+        the query finishes. The rest of the output is read in the background and
+        cached like _windows_device_scan's result, so the diagnostics share this
+        PowerShell run instead of starting another.
+        """
+        proc = subprocess.Popen(WINDOWS_DEVICE_SCAN_COMMAND, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+        timeout = threading.Timer(15, proc.kill)
+        timeout.start()
+        lines = []
+        
+        def finish():
+            try:
+                lines.extend(proc.stdout)
+                proc.wait()
+            finally:
+                timeout.cancel()
+                proc.stdout.close()
+            # A killed or failed scan isn't worth keeping
+            if proc.returncode == 0:
+                result = subprocess.CompletedProcess(WINDOWS_DEVICE_SCAN_COMMAND, 0, "".join(lines), "")
+                self._store_run(WINDOWS_DEVICE_SCAN_COMMAND, result, text=True)
+        
+        for line in proc.stdout:
+            lines.append(line)
+            if line.startswith("PNP:"):
+                threading.Thread(target=finish, daemon=True).start()
+                return True
+        finish()
+        return False
+    
     def _auto_detect_powershell_windows(self):
         """Automatically detect iPhone using PowerShell."""
         try:
-            # PowerShell script to find iPhone and get DCIM path
-            ps_script = '''
-            # Find Apple devices
-            $appleDevices = Get-PnpDevice | Where-Object {$_.FriendlyName -like "*iPhone*" -or $_.FriendlyName -like "*Apple*"}
-            
-            if ($appleDevices) {
-                Write-Output "APPLE_DEVICE_FOUND"
-            }
-            
-            # Check all removable drives for iPhone-style DCIM
-            Get-WmiObject -Class Win32_LogicalDisk | Where-Object {$_.DriveType -eq 2} | ForEach-Object {
-                $driveLetter = $_.DeviceID
-                $dcimPath = Join-Path $driveLetter "DCIM"
-                if (Test-Path $dcimPath) {
-                    $subfolders = Get-ChildItem $dcimPath -Directory -ErrorAction SilentlyContinue
-                    foreach ($folder in $subfolders) {
-                        if ($folder.Name -match "^\\d{3}APPLE$") {
-                            Write-Output "IPHONE_DCIM:$dcimPath"
-                            break
-                        }
-                    }
-                }
-            }
-            '''
-            
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
-                capture_output=True, text=True, timeout=15
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.startswith("IPHONE_DCIM:"):
-                        dcim_path = line.replace("IPHONE_DCIM:", "").strip()
-                        if os.path.exists(dcim_path):
-                            return dcim_path
+            # Look for the iPhone's DCIM folder on the removable drives whatever
+            # PnP reports; a phone can expose its drive before PnP lists it
+            for drive in _removable_drives():
+                if self._verify_iphone_device(drive):
+                    return os.path.join(drive, "DCIM")
+            
+            # PnP is only a hint as to why no drive turned up.
+            # Reuse this cycle's scan if the diagnostics already ran it
+            cached = self._cached_run(WINDOWS_DEVICE_SCAN_COMMAND, text=True)
+            if cached is not None:
+                apple_device_found = cached.returncode == 0 and "PNP:" in cached.stdout
+            else:
+                apple_device_found = self._stream_windows_device_scan()
+            if apple_device_found:
+                print("Apple device found by PnP, but no removable drive has its DCIM folder yet")
                             
             return None
             
@@ -1613,7 +1973,7 @@ class PhotoConverterApp(QMainWindow):
                                     drive_path = f"{drive_letter}:\\"
                                     if os.path.exists(drive_path):
                                         dcim_path = os.path.join(drive_path, "DCIM")
-                                        if os.path.exists(dcim_path) and self._verify_iphone_device(drive_path):
+                                        if self._verify_iphone_device(drive_path):
                                             return dcim_path
                             i += 1
                         except OSError:
@@ -1633,8 +1993,7 @@ class PhotoConverterApp(QMainWindow):
         """Automatically correlate USB devices with file system access."""
         try:
             # Check if any Apple USB devices are connected
-            devices = usb.core.find(find_all=True, idVendor=APPLE_VENDOR_ID)
-            apple_devices = list(devices)
+            apple_devices = self._apple_usb_devices()
             
             if not apple_devices:
                 return None
@@ -1647,14 +2006,13 @@ class PhotoConverterApp(QMainWindow):
             for partition in partitions:
                 try:
                     mount_point = partition.mountpoint
-                    if mount_point and os.path.exists(mount_point):
+                    if mount_point:
                         dcim_path = os.path.join(mount_point, "DCIM")
-                        if os.path.exists(dcim_path):
+                        if os.access(dcim_path, os.R_OK):
                             # Check if this DCIM contains iPhone-style content
                             try:
                                 items = os.listdir(dcim_path)
-                                apple_folders = [item for item in items if re.match(r'^\d{3}APPLE$', item)]
-                                if apple_folders:
+                                if any(APPLE_FOLDER_RE.match(item) for item in items):
                                     return dcim_path
                                     
                                 # Check for any photo files that might indicate iPhone
@@ -1694,7 +2052,7 @@ class PhotoConverterApp(QMainWindow):
                     mount_point = partition.mountpoint
                     if mount_point and os.path.exists(mount_point):
                         dcim_path = os.path.join(mount_point, "DCIM")
-                        if os.path.exists(dcim_path) and self._verify_iphone_device(mount_point):
+                        if self._verify_iphone_device(mount_point):
                             return dcim_path
                 except:
                     continue
@@ -1704,41 +2062,6 @@ class PhotoConverterApp(QMainWindow):
         except Exception:
             return None
     
-    def _find_iphone_mtp_windows(self):
-        """Find iPhone connected via MTP (Media Transfer Protocol)."""
-        try:
-            # Check common MTP mount points
-            user_profile = os.environ.get('USERPROFILE', 'C:\\Users\\Default')
-            possible_mtp_paths = [
-                os.path.join(user_profile, 'This PC'),
-                'Computer',
-                'This PC'
-            ]
-            
-            # Use PowerShell to find MTP devices
-            ps_script = """
-            Get-WmiObject -Class Win32_PnPEntity | Where-Object {
-                $_.Name -like "*iPhone*" -or $_.Name -like "*Apple*"
-            } | Select-Object Name, DeviceID
-            """
-            
-            try:
-                result = subprocess.run(
-                    ["powershell", "-Command", ps_script],
-                    capture_output=True, text=True, timeout=10
-                )
-                
-                if result.returncode == 0 and "iPhone" in result.stdout:
-                    # Try to find the device in Windows Explorer namespace
-                    return self._get_iphone_from_shell_namespace()
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"MTP detection failed: {e}")
-        
-        return None
-    
     def _find_iphone_shell_windows(self):
         """Use Windows Shell COM interface to find iPhone."""
         try:
@@ -1773,87 +2096,70 @@ class PhotoConverterApp(QMainWindow):
         
         return None
     
-    def _find_iphone_powershell_windows(self):
-        """Use PowerShell to detect iPhone and get its path."""
+    def _verify_iphone_device(self, device_path, dcim_entry=None):
+        """Verify that a device path actually belongs to an iPhone.
+
+        The verdict is cached until the DCIM folder's mtime changes, so
+        repeated detections don't rescan the device. Pass the DCIM folder's
+        DirEntry if the caller has one; on Windows its stat needs no extra
+        system call.
+        """
         try:
-            # PowerShell script to find iPhone and get DCIM path
-            ps_script = '''
-            $devices = Get-PnpDevice | Where-Object {$_.FriendlyName -like "*iPhone*" -or $_.FriendlyName -like "*Apple*"}
-            foreach ($device in $devices) {
-                $devicePath = (Get-PnpDeviceProperty -InstanceId $device.InstanceId -KeyName 'DEVPKEY_Device_DriverInfPath' -ErrorAction SilentlyContinue).Data
-                if ($devicePath) {
-                    Write-Output "Device: $($device.FriendlyName)"
-                    Write-Output "Path: $devicePath"
-                }
-            }
-            
-            # Also check for drive letters that might be iPhone
-            Get-WmiObject -Class Win32_LogicalDisk | Where-Object {$_.DriveType -eq 2} | ForEach-Object {
-                $driveLetter = $_.DeviceID
-                $dcimPath = Join-Path $driveLetter "DCIM"
-                if (Test-Path $dcimPath) {
-                    # Check if it looks like iPhone by looking for typical iOS folder structure
-                    $subfolders = Get-ChildItem $dcimPath -Directory -ErrorAction SilentlyContinue
-                    foreach ($folder in $subfolders) {
-                        if ($folder.Name -match "^\d{3}APPLE$") {
-                            Write-Output "iPhone-DCIM: $dcimPath"
-                            break
-                        }
-                    }
-                }
-            }
-            '''
-            
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_script],
-                capture_output=True, text=True, timeout=15
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.startswith("iPhone-DCIM:"):
-                        dcim_path = line.replace("iPhone-DCIM:", "").strip()
-                        if os.path.exists(dcim_path):
-                            return dcim_path
-                            
-        except subprocess.TimeoutExpired:
-            print("PowerShell detection timed out")
-        except Exception as e:
-            print(f"PowerShell detection failed: {e}")
+            if dcim_entry is not None:
+                dcim_path = dcim_entry.path
+                mtime_ns = dcim_entry.stat().st_mtime_ns
+            else:
+                dcim_path = os.path.join(device_path, "DCIM")
+                mtime_ns = os.stat(dcim_path).st_mtime_ns
+        except OSError:
+            # No readable DCIM folder
+            return False
         
-        return None
+        cached = self._dcim_cache.get(dcim_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        try:
+            with os.scandir(dcim_path) as it:
+                is_iphone = self._verify_dcim_entries(it)
+        except OSError:
+            # No readable DCIM folder
+            return False
+        self._dcim_cache[dcim_path] = (mtime_ns, is_iphone)
+        return is_iphone
     
-    def _verify_iphone_device(self, device_path):
-        """Verify that a device path actually belongs to an iPhone."""
+    def _verify_dcim_entries(self, entries):
+        """Check the entries of a DCIM folder for the layout an iPhone creates.
+
+        Takes an open os.scandir iterator; the caller owns and closes it.
+        """
         try:
-            dcim_path = os.path.join(device_path, "DCIM")
-            if not os.path.exists(dcim_path):
-                return False
-            
             # Look for typical iPhone folder structure
             # iPhone creates folders like "100APPLE", "101APPLE", etc.
-            subfolders = os.listdir(dcim_path)
-            for folder in subfolders:
-                if re.match(r'^\d{3}APPLE$', folder):
+            other_folders = []
+            for entry in entries:
+                if APPLE_FOLDER_RE.match(entry.name):
                     return True
+                if entry.is_dir(follow_symlinks=False):
+                    other_folders.append(entry.path)
             
-            # Also check for common iPhone photo patterns
-            for folder in subfolders:
-                folder_path = os.path.join(dcim_path, folder)
-                if os.path.isdir(folder_path):
-                    try:
-                        files = os.listdir(folder_path)
+            # No APPLE folder, so check for common iPhone photo patterns
+            for folder_path in other_folders:
+                try:
+                    with os.scandir(folder_path) as files:
                         # Look for iPhone-style filenames (IMG_xxxx.HEIC, etc.)
-                        for file in files[:10]:  # Check first 10 files
-                            if (file.upper().startswith('IMG_') and 
-                                (file.upper().endswith('.HEIC') or file.upper().endswith('.JPG'))):
+                        for file in islice(files, 10):  # Check first 10 files
+                            name = file.name.upper()
+                            if name.startswith('IMG_') and name.endswith(('.HEIC', '.JPG')):
                                 return True
-                    except:
-                        continue
+                except OSError:
+                    continue
             
-            return True  # If DCIM exists, assume it might be an iPhone
+            return False
             
+        except OSError:
+            # The DCIM folder stopped being readable part way through
+            return False
         except Exception as e:
             print(f"Device verification failed: {e}")
             return False
@@ -1864,14 +2170,11 @@ class PhotoConverterApp(QMainWindow):
         # We'll try to use the device instance to find a corresponding drive letter
         try:
             if hasattr(device, 'DeviceID') and device.DeviceID:
-                # Try to correlate with logical disks
-                import wmi
-                c = wmi.WMI()
-                for disk in c.Win32_LogicalDisk():
-                    if disk.DriveType == 2:  # Removable
-                        dcim_path = os.path.join(disk.DeviceID, "DCIM")
-                        if os.path.exists(dcim_path):
-                            return dcim_path
+                # Try to correlate with removable drives
+                for drive in _removable_drives():
+                    dcim_path = _find_dcim(drive)
+                    if dcim_path:
+                        return dcim_path
         except:
             pass
         
@@ -1976,7 +2279,7 @@ class PhotoConverterApp(QMainWindow):
                     if mount_point and os.path.exists(mount_point):
                         # Check for DCIM directly
                         dcim_path = os.path.join(mount_point, "DCIM")
-                        if os.path.exists(dcim_path) and self._verify_iphone_device(mount_point):
+                        if self._verify_iphone_device(mount_point):
                             return dcim_path
                         
                         # Check for nested iPhone folders
@@ -2005,74 +2308,123 @@ class PhotoConverterApp(QMainWindow):
         
         return None
     
-    def _get_iphone_from_shell_namespace(self):
-        """Try to get iPhone path from Windows Shell namespace."""
+    def _linux_device_mounts(self):
+        """List mount points from /proc/mounts that may belong to a phone."""
+        candidates = []
         try:
-            # Use Windows API to enumerate portable devices
-            # This is a fallback method
-            import win32api
-            drives = win32api.GetLogicalDriveStrings()
-            drives = drives.split('\000')[:-1]
-            
-            for drive in drives:
+            with open('/proc/mounts', 'rb') as f:
+                mounts = f.read()
+        except OSError:
+            return candidates
+        
+        for line in mounts.splitlines():
+            # Cheap substring test first; only the few matching lines get parsed
+            line_lower = line.lower()
+            if (b' fuse.' not in line and b'iphone' not in line_lower and
+                    b'apple' not in line_lower and b'mtp' not in line_lower):
+                continue
+            
+            parts = os.fsdecode(line).split()
+            if len(parts) < 3:
+                continue
+            fstype = parts[2]
+            if fstype not in LINUX_DEVICE_FSTYPES and not (
+                    b'iphone' in line_lower or b'apple' in line_lower or b'mtp' in line_lower):
+                continue
+            
+            # The mount table escapes spaces and other special characters in octal
+            mount_point = MOUNT_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), parts[1])
+            if fstype == 'fuse.gvfsd-fuse':
+                # GVFS mounts each device in its own folder under one FUSE mount
                 try:
-                    drive_type = win32api.GetDriveType(drive)
-                    if drive_type == win32api.DRIVE_REMOVABLE:
-                        dcim_path = os.path.join(drive, "DCIM")
-                        if os.path.exists(dcim_path) and self._verify_iphone_device(drive):
-                            return dcim_path
-                except:
-                    continue
-                    
-        except ImportError:
-            pass
-        except Exception as e:
-            print(f"Shell namespace detection failed: {e}")
+                    with os.scandir(mount_point) as it:
+                        candidates.extend(entry.path for entry in it)
+                except OSError:
+                    pass
+            else:
+                candidates.append(mount_point)
         
-        return None
+        return candidates
     
     def _find_iphone_linux(self):
         """Enhanced iPhone detection for Linux with multiple methods."""
+        # The methods are independent and mostly wait on subprocesses, so run
+        # them side by side. They are listed in order of preference.
+        methods = [
+            self._find_iphone_mounts_linux,
+            self._find_iphone_lsusb_linux,
+            self._find_iphone_udisks_linux,
+            self._find_iphone_dmesg_linux,
+        ]
         
-        # Method 1: Check standard mount points
-        user_id = os.getuid() if hasattr(os, 'getuid') else 1000
-        username = os.environ.get("USER", "user")
+        executor = ThreadPoolExecutor(max_workers=len(methods))
+        futures = [executor.submit(method) for method in methods]
+        try:
+            for _ in as_completed(futures):
+                # Use the first method that found the iPhone once every method
+                # ahead of it has finished without finding it
+                for future in futures:
+                    if not future.done():
+                        break
+                    if future.result():
+                        return future.result()
+        finally:
+            # Stop waiting on the slower methods; they finish in the background
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
         
-        possible_paths = [
-            f"/run/user/{user_id}/gvfs",
-            f"/media/{username}",
-            "/media",
-            "/mnt",
-            "/tmp",
-            f"/home/{username}/.gvfs"
-        ]
+        return None
+    
+    def _find_iphone_mounts_linux(self):
+        """Look for the iPhone among mounted filesystems."""
+        # Check the device mounts listed in /proc/mounts
+        candidates = self._linux_device_mounts()
+        for mount_point in candidates:
+            if self._verify_iphone_device(mount_point):
+                return os.path.join(mount_point, "DCIM")
         
-        for base_path in possible_paths:
-            if os.path.exists(base_path):
-                try:
-                    for device in os.listdir(base_path):
-                        device_path = os.path.join(base_path, device)
-                        device_lower = device.lower()
+        # None of them is an iPhone, so probe the standard mount points too,
+        # skipping the mounts already checked above
+        checked = set(candidates)
+        
+        for base_path in self._linux_scan_bases:
+            # Opening the folder is the existence and permission check in one call
+            try:
+                base_fd = os.open(base_path, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                continue
+            try:
+                with os.scandir(base_fd) as it:
+                    for entry in it:
+                        # Plain files can't be a device mount
+                        if not entry.is_dir():
+                            continue
+                        device_path = os.path.join(base_path, entry.name)
+                        if device_path in checked:
+                            continue
                         
                         # Check if this looks like an iPhone
-                        if ("iphone" in device_lower or "apple" in device_lower or 
-                            "ios" in device_lower or device_lower.startswith("iph") or
-                            "mtp" in device_lower):
+                        if IPHONE_NAME_RE.search(entry.name):
                             dcim_path = os.path.join(device_path, "DCIM")
-                            if os.path.exists(dcim_path) and self._verify_iphone_device(device_path):
+                            if self._verify_iphone_device(device_path):
                                 return dcim_path
                         
-                        # Also check any device that has a DCIM directory
-                        if os.path.isdir(device_path):
-                            dcim_path = os.path.join(device_path, "DCIM")
-                            if os.path.exists(dcim_path) and self._verify_iphone_device(device_path):
-                                return dcim_path
-                except:
-                    pass
+                        # Also check any other device that has a DCIM directory
+                        elif self._verify_iphone_device(device_path):
+                            return os.path.join(device_path, "DCIM")
+            except OSError:
+                # The folder went away or became unreadable while scanning
+                continue
+            finally:
+                os.close(base_fd)
         
-        # Method 2: Use lsusb to find connected Apple devices
+        return None
+    
+    def _find_iphone_lsusb_linux(self):
+        """Use lsusb to find connected Apple devices."""
         try:
-            result = subprocess.run(["lsusb"], capture_output=True, text=True, timeout=10)
+            result = self._run_cached(["lsusb"], capture_output=True, text=True, timeout=10)
             if result.returncode == 0 and ("Apple" in result.stdout or "iPhone" in result.stdout):
                 # Apple device detected, try to find its mount point
                 iphone_path = self._find_apple_device_mount_linux()
@@ -2081,25 +2433,12 @@ class PhotoConverterApp(QMainWindow):
         except:
             pass
         
-        # Method 3: Check /proc/mounts for mounted filesystems
-        try:
-            with open('/proc/mounts', 'r') as f:
-                mounts = f.read()
-                
-            for line in mounts.split('\n'):
-                if line and ('iphone' in line.lower() or 'apple' in line.lower() or 'mtp' in line.lower()):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        mount_point = parts[1]
-                        dcim_path = os.path.join(mount_point, "DCIM")
-                        if os.path.exists(dcim_path):
-                            return dcim_path
-        except:
-            pass
-        
-        # Method 4: Use udisksctl to find block devices
+        return None
+    
+    def _find_iphone_udisks_linux(self):
+        """Use udisksctl to find block devices."""
         try:
-            result = subprocess.run(["udisksctl", "status"], capture_output=True, text=True, timeout=10)
+            result = self._run_cached(["udisksctl", "status"], capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 lines = result.stdout.split('\n')
                 for line in lines:
@@ -2111,47 +2450,62 @@ class PhotoConverterApp(QMainWindow):
         except:
             pass
         
-        # Method 5: Check dmesg for recently connected Apple devices
+        return None
+    
+    def _find_iphone_dmesg_linux(self):
+        """Check dmesg for recently connected Apple devices."""
         try:
-            result = subprocess.run(["dmesg", "|", "tail", "-100"], 
-                                  shell=True, capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and ("Apple" in result.stdout or "iPhone" in result.stdout):
+            result = self._run_cached(["dmesg"], capture_output=True, text=True, timeout=5)
+            recent = result.stdout.splitlines()[-100:] if result.returncode == 0 else []
+        except (OSError, subprocess.SubprocessError):
+            recent = []
+        
+        if not recent:
+            # Reading dmesg may be restricted to root, but the kernel log has the same messages
+            try:
+                with open('/var/log/kern.log', 'r', errors='replace') as f:
+                    recent = deque(f, 100)
+            except OSError:
+                return None
+        
+        try:
+            recent = "\n".join(recent)
+            if "Apple" in recent or "iPhone" in recent:
                 # Device was recently connected, try harder to find it
                 iphone_path = self._scan_all_mount_points_linux()
                 if iphone_path:
                     return iphone_path
         except:
             pass
-                    
+        
         return None
     
     def _find_apple_device_mount_linux(self):
         """Find Apple device mount point on Linux."""
         try:
             # Check common GVFS mount locations for MTP devices
-            user_id = os.getuid() if hasattr(os, 'getuid') else 1000
-            gvfs_path = f"/run/user/{user_id}/gvfs"
+            gvfs_path = self._gvfs_base
             
-            if os.path.exists(gvfs_path):
+            if os.access(gvfs_path, os.R_OK):
                 for mount in os.listdir(gvfs_path):
                     mount_path = os.path.join(gvfs_path, mount)
                     if ("mtp" in mount.lower() or "apple" in mount.lower() or 
                         "iphone" in mount.lower()):
                         
                         # Look for DCIM folder in this MTP device
-                        dcim_path = os.path.join(mount_path, "DCIM")
-                        if os.path.exists(dcim_path):
+                        dcim_path = _find_dcim(mount_path)
+                        if dcim_path:
                             return dcim_path
                         
                         # Some devices might have DCIM nested deeper
                         try:
-                            for item in os.listdir(mount_path):
-                                item_path = os.path.join(mount_path, item)
-                                if os.path.isdir(item_path):
-                                    dcim_path = os.path.join(item_path, "DCIM")
-                                    if os.path.exists(dcim_path):
-                                        return dcim_path
-                        except:
+                            with os.scandir(mount_path) as it:
+                                for entry in it:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        dcim_path = _find_dcim(entry.path)
+                                        if dcim_path:
+                                            return dcim_path
+                        except OSError:
                             continue
         except:
             pass
@@ -2166,7 +2520,7 @@ class PhotoConverterApp(QMainWindow):
             for part in parts:
                 if part.startswith('/dev/'):
                     # Get detailed info about this device
-                    result = subprocess.run(
+                    result = self._run_cached(
                         ["udisksctl", "info", "-b", part],
                         capture_output=True, text=True, timeout=5
                     )
@@ -2179,8 +2533,8 @@ class PhotoConverterApp(QMainWindow):
                                 if mount_point and mount_point != '[]':
                                     # Clean up the mount point format
                                     mount_point = mount_point.strip('[]').strip()
-                                    dcim_path = os.path.join(mount_point, "DCIM")
-                                    if os.path.exists(dcim_path):
+                                    dcim_path = _find_dcim(mount_point)
+                                    if dcim_path:
                                         return dcim_path
         except:
             pass
@@ -2190,19 +2544,17 @@ class PhotoConverterApp(QMainWindow):
     def _scan_all_mount_points_linux(self):
         """Scan all mount points to find iPhone DCIM folder."""
         try:
-            result = subprocess.run(["mount"], capture_output=True, text=True, timeout=5)
+            result = self._run_cached(["mount"], capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 lines = result.stdout.split('\n')
                 for line in lines:
                     parts = line.split()
                     if len(parts) >= 3:
                         mount_point = parts[2]
-                        if os.path.exists(mount_point):
-                            dcim_path = os.path.join(mount_point, "DCIM")
-                            if os.path.exists(dcim_path) and self._verify_iphone_device(mount_point):
-                                return dcim_path
-        except:
-            pass
+                        if self._verify_iphone_device(mount_point):
+                            return os.path.join(mount_point, "DCIM")
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"Mount point scan failed: {e}")
         
         return None
     
@@ -2256,22 +2608,18 @@ class PhotoConverterApp(QMainWindow):
             self.update_status(f"Output folder: {self.output_folder}")
     
     def update_status(self, message):
-        # This method may be called from another thread
-        # Use the signal/slot mechanism to update the UI safely
-        if threading.current_thread() is threading.main_thread():
-            self.status_label.setText(message)
-        else:
-            # Use PyQt's thread-safe way to update UI
-            self.status_label.setText(message)
+        # This method may be called from another thread, so go through the signal
+        # rather than touching the label directly
+        self.status_changed.emit(message)
     
     def update_progress(self, value):
         self.progress_bar.setValue(value)
     
     def open_folder(self, path):
         """Open the folder with the default file manager"""
-        if platform.system() == "Windows":
+        if SYSTEM == "Windows":
             os.startfile(path)
-        elif platform.system() == "Darwin":  # macOS
+        elif SYSTEM == "Darwin":  # macOS
             subprocess.run(["open", path])
         else:  # Linux
             subprocess.run(["xdg-open", path])
@@ -2281,6 +2629,7 @@ class PhotoConverterApp(QMainWindow):
         if self.worker_thread and self.worker_thread.isRunning():
             self.worker_thread.stop()
             self.worker_thread.wait()
+        self._dcim_cache.clear()
         event.accept()
 
 def main():
@@ -2291,4 +2640,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Needed for the conversion worker processes in frozen executables
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file